@@ -13,14 +13,15 @@ classes for other XSD built-in types. This subpackage raises only built-in
 exceptions in order to be reusable in other packages.
 """
 from decimal import Decimal
-from typing import Dict, Optional, Union
+from functools import lru_cache
+from typing import Any, Dict, Optional, Union
 
 from ..namespaces import XSD_NAMESPACE
 from ..protocols import XsdTypeProtocol
 
 from .atomic_types import xsd10_atomic_types, xsd11_atomic_types, \
     AtomicTypeMeta, AnyAtomicType
-from .untyped import UntypedAtomic
+from .untyped import _OPERAND_CASTS, _get_operand_cast, UntypedAtomic
 from .qname import AbstractQName, QName, Notation
 from .numeric import Float10, Float, Integer, Int, NegativeInteger, \
     PositiveInteger, NonNegativeInteger, NonPositiveInteger, Long, \
@@ -40,59 +41,69 @@ xsd11_atomic_types.update(
     (k, v) for k, v in xsd10_atomic_types.items() if k not in xsd11_atomic_types
 )
 
+# Fill the casts of untyped operands once, for the builtin atomic types
+for _cls in {*xsd10_atomic_types.values(), *xsd11_atomic_types.values()}:
+    _cast = _get_operand_cast(_cls)
+    if _cast is not None:
+        _OPERAND_CASTS.setdefault(_cls, _cast)
+del _cls, _cast
+
 DatetimeValueType = AbstractDateTime  # keep until v5.0 for backward compatibility
 AtomicValueType = Union[str, int, float, Decimal, bool, AnyAtomicType]
 
 
-ATOMIC_VALUES: Dict[Optional[str], AtomicValueType] = {
-    f'{{{XSD_NAMESPACE}}}untypedAtomic': UntypedAtomic('1'),
-    f'{{{XSD_NAMESPACE}}}anyType': UntypedAtomic('1'),
-    f'{{{XSD_NAMESPACE}}}anySimpleType': UntypedAtomic('1'),
-    f'{{{XSD_NAMESPACE}}}anyAtomicType': UntypedAtomic('1'),
-    f'{{{XSD_NAMESPACE}}}boolean': True,
-    f'{{{XSD_NAMESPACE}}}decimal': Decimal('1.0'),
-    f'{{{XSD_NAMESPACE}}}double': 1.0,
-    f'{{{XSD_NAMESPACE}}}float': Float10(1.0),
-    f'{{{XSD_NAMESPACE}}}string': '  alpha\t',
-    f'{{{XSD_NAMESPACE}}}date': Date.fromstring('2000-01-01'),
-    f'{{{XSD_NAMESPACE}}}dateTime': DateTime.fromstring('2000-01-01T12:00:00'),
-    f'{{{XSD_NAMESPACE}}}gDay': GregorianDay.fromstring('---31'),
-    f'{{{XSD_NAMESPACE}}}gMonth': GregorianMonth.fromstring('--12'),
-    f'{{{XSD_NAMESPACE}}}gMonthDay': GregorianMonthDay.fromstring('--12-01'),
-    f'{{{XSD_NAMESPACE}}}gYear': GregorianYear.fromstring('1999'),
-    f'{{{XSD_NAMESPACE}}}gYearMonth': GregorianYearMonth.fromstring('1999-09'),
-    f'{{{XSD_NAMESPACE}}}time': Time.fromstring('09:26:54'),
-    f'{{{XSD_NAMESPACE}}}duration': Duration.fromstring('P1MT1S'),
-    f'{{{XSD_NAMESPACE}}}dayTimeDuration': DayTimeDuration.fromstring('P1DT1S'),
-    f'{{{XSD_NAMESPACE}}}yearMonthDuration': YearMonthDuration.fromstring('P1Y1M'),
-    f'{{{XSD_NAMESPACE}}}QName': QName("http://www.w3.org/2001/XMLSchema", 'xs:element'),
-    f'{{{XSD_NAMESPACE}}}anyURI': AnyURI('https://example.com'),
-    f'{{{XSD_NAMESPACE}}}normalizedString': NormalizedString(' alpha  '),
-    f'{{{XSD_NAMESPACE}}}token': XsdToken('a token'),
-    f'{{{XSD_NAMESPACE}}}language': Language('en-US'),
-    f'{{{XSD_NAMESPACE}}}Name': Name('_a.name::'),
-    f'{{{XSD_NAMESPACE}}}NCName': NCName('nc-name'),
-    f'{{{XSD_NAMESPACE}}}ID': Id('id1'),
-    f'{{{XSD_NAMESPACE}}}IDREF': Idref('id_ref1'),
-    f'{{{XSD_NAMESPACE}}}ENTITY': Entity('entity1'),
-    f'{{{XSD_NAMESPACE}}}NMTOKEN': NMToken('a_token'),
-    f'{{{XSD_NAMESPACE}}}base64Binary': Base64Binary(b'YWxwaGE='),
-    f'{{{XSD_NAMESPACE}}}hexBinary': HexBinary(b'31'),
-    f'{{{XSD_NAMESPACE}}}dateTimeStamp': DateTimeStamp.fromstring('2000-01-01T12:00:00+01:00'),
-    f'{{{XSD_NAMESPACE}}}integer': Integer(1),
-    f'{{{XSD_NAMESPACE}}}long': Long(1),
-    f'{{{XSD_NAMESPACE}}}int': Int(1),
-    f'{{{XSD_NAMESPACE}}}short': Short(1),
-    f'{{{XSD_NAMESPACE}}}byte': Byte(1),
-    f'{{{XSD_NAMESPACE}}}positiveInteger': PositiveInteger(1),
-    f'{{{XSD_NAMESPACE}}}negativeInteger': NegativeInteger(-1),
-    f'{{{XSD_NAMESPACE}}}nonPositiveInteger': NonPositiveInteger(0),
-    f'{{{XSD_NAMESPACE}}}nonNegativeInteger': NonNegativeInteger(0),
-    f'{{{XSD_NAMESPACE}}}unsignedLong': UnsignedLong(1),
-    f'{{{XSD_NAMESPACE}}}unsignedInt': UnsignedInt(1),
-    f'{{{XSD_NAMESPACE}}}unsignedShort': UnsignedShort(1),
-    f'{{{XSD_NAMESPACE}}}unsignedByte': UnsignedByte(1),
-}
+@lru_cache(maxsize=None)
+def _get_atomic_values() -> Dict[Optional[str], AtomicValueType]:
+    """Builds the map of sample atomic values only when it's used the first time."""
+    return {
+        f'{{{XSD_NAMESPACE}}}untypedAtomic': UntypedAtomic('1'),
+        f'{{{XSD_NAMESPACE}}}anyType': UntypedAtomic('1'),
+        f'{{{XSD_NAMESPACE}}}anySimpleType': UntypedAtomic('1'),
+        f'{{{XSD_NAMESPACE}}}anyAtomicType': UntypedAtomic('1'),
+        f'{{{XSD_NAMESPACE}}}boolean': True,
+        f'{{{XSD_NAMESPACE}}}decimal': Decimal('1.0'),
+        f'{{{XSD_NAMESPACE}}}double': 1.0,
+        f'{{{XSD_NAMESPACE}}}float': Float10(1.0),
+        f'{{{XSD_NAMESPACE}}}string': '  alpha\t',
+        f'{{{XSD_NAMESPACE}}}date': Date.fromstring('2000-01-01'),
+        f'{{{XSD_NAMESPACE}}}dateTime': DateTime.fromstring('2000-01-01T12:00:00'),
+        f'{{{XSD_NAMESPACE}}}gDay': GregorianDay.fromstring('---31'),
+        f'{{{XSD_NAMESPACE}}}gMonth': GregorianMonth.fromstring('--12'),
+        f'{{{XSD_NAMESPACE}}}gMonthDay': GregorianMonthDay.fromstring('--12-01'),
+        f'{{{XSD_NAMESPACE}}}gYear': GregorianYear.fromstring('1999'),
+        f'{{{XSD_NAMESPACE}}}gYearMonth': GregorianYearMonth.fromstring('1999-09'),
+        f'{{{XSD_NAMESPACE}}}time': Time.fromstring('09:26:54'),
+        f'{{{XSD_NAMESPACE}}}duration': Duration.fromstring('P1MT1S'),
+        f'{{{XSD_NAMESPACE}}}dayTimeDuration': DayTimeDuration.fromstring('P1DT1S'),
+        f'{{{XSD_NAMESPACE}}}yearMonthDuration': YearMonthDuration.fromstring('P1Y1M'),
+        f'{{{XSD_NAMESPACE}}}QName': QName("http://www.w3.org/2001/XMLSchema", 'xs:element'),
+        f'{{{XSD_NAMESPACE}}}anyURI': AnyURI('https://example.com'),
+        f'{{{XSD_NAMESPACE}}}normalizedString': NormalizedString(' alpha  '),
+        f'{{{XSD_NAMESPACE}}}token': XsdToken('a token'),
+        f'{{{XSD_NAMESPACE}}}language': Language('en-US'),
+        f'{{{XSD_NAMESPACE}}}Name': Name('_a.name::'),
+        f'{{{XSD_NAMESPACE}}}NCName': NCName('nc-name'),
+        f'{{{XSD_NAMESPACE}}}ID': Id('id1'),
+        f'{{{XSD_NAMESPACE}}}IDREF': Idref('id_ref1'),
+        f'{{{XSD_NAMESPACE}}}ENTITY': Entity('entity1'),
+        f'{{{XSD_NAMESPACE}}}NMTOKEN': NMToken('a_token'),
+        f'{{{XSD_NAMESPACE}}}base64Binary': Base64Binary(b'YWxwaGE='),
+        f'{{{XSD_NAMESPACE}}}hexBinary': HexBinary(b'31'),
+        f'{{{XSD_NAMESPACE}}}dateTimeStamp': DateTimeStamp.fromstring('2000-01-01T12:00:00+01:00'),
+        f'{{{XSD_NAMESPACE}}}integer': Integer(1),
+        f'{{{XSD_NAMESPACE}}}long': Long(1),
+        f'{{{XSD_NAMESPACE}}}int': Int(1),
+        f'{{{XSD_NAMESPACE}}}short': Short(1),
+        f'{{{XSD_NAMESPACE}}}byte': Byte(1),
+        f'{{{XSD_NAMESPACE}}}positiveInteger': PositiveInteger(1),
+        f'{{{XSD_NAMESPACE}}}negativeInteger': NegativeInteger(-1),
+        f'{{{XSD_NAMESPACE}}}nonPositiveInteger': NonPositiveInteger(0),
+        f'{{{XSD_NAMESPACE}}}nonNegativeInteger': NonNegativeInteger(0),
+        f'{{{XSD_NAMESPACE}}}unsignedLong': UnsignedLong(1),
+        f'{{{XSD_NAMESPACE}}}unsignedInt': UnsignedInt(1),
+        f'{{{XSD_NAMESPACE}}}unsignedShort': UnsignedShort(1),
+        f'{{{XSD_NAMESPACE}}}unsignedByte': UnsignedByte(1),
+    }
 
 
 def get_atomic_value(xsd_type: Optional[XsdTypeProtocol]) -> AtomicValueType:
@@ -100,15 +111,22 @@ def get_atomic_value(xsd_type: Optional[XsdTypeProtocol]) -> AtomicValueType:
     if xsd_type is None:
         return UntypedAtomic('1')
 
+    atomic_values = _get_atomic_values()
     try:
-        return ATOMIC_VALUES[xsd_type.name]
+        return atomic_values[xsd_type.name]
     except KeyError:
         try:
-            return ATOMIC_VALUES[xsd_type.root_type.name]
+            return atomic_values[xsd_type.root_type.name]
         except KeyError:
             return UntypedAtomic('1')
 
 
+def __getattr__(name: str) -> Any:
+    if name == 'ATOMIC_VALUES':
+        return _get_atomic_values()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = ['xsd10_atomic_types', 'xsd11_atomic_types', 'get_atomic_value',
            'AtomicTypeMeta', 'AnyAtomicType', 'NumericProxy', 'ArithmeticProxy',
            'AbstractDateTime', 'DateTime10', 'DateTime', 'DateTimeStamp', 'Date10',
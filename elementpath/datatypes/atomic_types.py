@@ -26,6 +26,28 @@ xsd11_atomic_types: Dict[Optional[str], 'AtomicTypeMeta'] = {}
 """Dictionary of builtin XSD 1.1 atomic types."""
 
 
+class LazyPattern:
+    """
+    A descriptor for a class regex pattern that is compiled at first access. The
+    compiled pattern then replaces the descriptor in the class that defines it.
+
+    :param pattern: the regex pattern string.
+    :param flags: the regex flags.
+    """
+    def __init__(self, pattern: str, flags: int = 0) -> None:
+        self._pattern = pattern
+        self._flags = flags
+
+    def __set_name__(self, owner: Type[Any], name: str) -> None:
+        self._owner = owner
+        self._name = name
+
+    def __get__(self, instance: Optional[Any], owner: Type[Any]) -> Pattern[str]:
+        compiled = re.compile(self._pattern, self._flags)
+        setattr(self._owner, self._name, compiled)
+        return compiled
+
+
 class AtomicTypeMeta(ABCMeta):
     """
     Metaclass for creating XSD atomic types. The created classes
@@ -55,8 +77,8 @@ class AtomicTypeMeta(ABCMeta):
         # Add missing attributes and methods
         if not hasattr(cls, 'xsd_version'):
             cls.xsd_version = '1.0'
-        if not hasattr(cls, 'pattern'):
-            cls.pattern = re.compile(r'^$')
+        if all('pattern' not in c.__dict__ for c in cls.__mro__):
+            cls.pattern = re.compile(r'^$')  # don't use hasattr(), it compiles lazy patterns
 
         # Register class with a name
         if name:
@@ -97,4 +119,5 @@ class AtomicTypeMeta(ABCMeta):
 
 
 class AnyAtomicType(metaclass=AtomicTypeMeta):
+    __slots__ = ()
     name = 'anyAtomicType'
@@ -8,14 +8,25 @@
 # @author Davide Brunato <brunato@sissa.it>
 #
 from abc import abstractmethod
-from typing import Any, Callable, Union
+from typing import Any, Callable, Tuple, Union
+import binascii
 import re
-import codecs
 
 from ..helpers import collapse_white_spaces
-from .atomic_types import AnyAtomicType
+from .atomic_types import AnyAtomicType, LazyPattern
 from .untyped import UntypedAtomic
 
+# ASCII characters matched by WHITESPACES_PATTERN, for collapsing bytes without decoding
+BYTES_WHITESPACES_PATTERN = re.compile(rb'[\s\x1c-\x1f]+')
+
+BASE64_ALPHABET = b'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/'
+
+# Translation table for classifying base64 characters: 0x01 for characters
+# of the base64 alphabet, 0x02 for the padding character, 0xff for others.
+BASE64_CHAR_CLASSES = bytes(
+    1 if c in BASE64_ALPHABET else 2 if c == 0x3D else 0xff for c in range(256)
+)
+
 
 class AbstractBinary(AnyAtomicType):
     """
@@ -24,6 +35,7 @@ class AbstractBinary(AnyAtomicType):
     :param value: a string or a binary data or an untyped atomic instance.
     :param ordered: a boolean that enable total ordering for the instance, `False` for default.
     """
+    __slots__ = 'value', 'ordered'
     value: bytes
     invalid_type: Callable[[Any], TypeError]
 
@@ -31,12 +43,18 @@ class AbstractBinary(AnyAtomicType):
                  ordered: bool = False) -> None:
         self.ordered = ordered
 
+        # Values of binary instances are already valid, so they are not checked again
         if isinstance(value, self.__class__):
             self.value = value.value
         elif isinstance(value, AbstractBinary):
             self.value = self.encoder(value.decode())
         else:
-            if isinstance(value, UntypedAtomic):
+            if isinstance(value, bytes) and value.isascii():
+                value = BYTES_WHITESPACES_PATTERN.sub(b' ', value).strip(b' ')
+                self.validate(value)
+                self.value = value.replace(b' ', b'')
+                return
+            elif isinstance(value, UntypedAtomic):
                 value = collapse_white_spaces(value.value)
             elif isinstance(value, str):
                 value = collapse_white_spaces(value)
@@ -51,6 +69,9 @@ class AbstractBinary(AnyAtomicType):
     def __repr__(self) -> str:
         return '%s(%r)' % (self.__class__.__name__, self.value)
 
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return self.__class__, (self.value, self.ordered)
+
     def __bytes__(self) -> bytes:
         return self.value
 
@@ -115,8 +136,9 @@ class AbstractBinary(AnyAtomicType):
 
 
 class Base64Binary(AbstractBinary):
+    __slots__ = ()
     name = 'base64Binary'
-    pattern = re.compile(
+    pattern = LazyPattern(
         r'((?:(?:[A-Za-z0-9+/] ?){4})*(?:(?:[A-Za-z0-9+/] ?){3}[A-Za-z0-9+/]|'
         r'(?:[A-Za-z0-9+/] ?){2}'
         r'[AEIMQUYcgkosw048] ?=|[A-Za-z0-9+/] ?[AQgw] ?= ?=))?'
@@ -124,18 +146,43 @@ class Base64Binary(AbstractBinary):
 
     @classmethod
     def validate(cls, value: object) -> None:
+        data: Union[str, bytes]
         if isinstance(value, cls):
             return
         elif isinstance(value, bytes):
-            value = value.decode()
-        elif not isinstance(value, str):
+            data = value.replace(b' ', b'')
+        elif isinstance(value, str):
+            data = value.replace(' ', '')
+        else:
             raise cls.invalid_type(value)
 
-        value = value.replace(' ', '')
-        if value:
-            match = cls.pattern.match(value)
-            if match is None or match.group(0) != value:
-                raise cls.invalid_value(value)
+        if data and not cls.is_base64(data):
+            if isinstance(data, bytes):
+                data = data.decode()  # report the value as a string
+            raise cls.invalid_value(data)
+
+    @staticmethod
+    def is_base64(value: Union[str, bytes]) -> bool:
+        """
+        Checks a not empty string without spaces against the base64 lexical space,
+        using a single scan on the classes of the characters instead of a regex.
+        """
+        if len(value) % 4 or not value.isascii():
+            return False
+
+        data = value.encode('ascii') if isinstance(value, str) else value
+        char_classes = data.translate(BASE64_CHAR_CLASSES)
+        if b'\xff' in char_classes:
+            return False
+
+        padding = char_classes.find(b'\x02')
+        if padding < 0:
+            return True
+        elif padding == len(data) - 1:
+            return data[-2] in b'AEIMQUYcgkosw048'
+        elif padding == len(data) - 2:
+            return char_classes[-1] == 2 and data[-3] in b'AQgw'
+        return False
 
     def __str__(self) -> str:
         return self.value.decode('utf-8')
@@ -155,35 +202,47 @@ class Base64Binary(AbstractBinary):
 
     @staticmethod
     def encoder(value: bytes) -> bytes:
-        return codecs.encode(value, 'base64').rstrip(b'\n')
+        return binascii.b2a_base64(value, newline=False)
 
     def decode(self) -> bytes:
-        return codecs.decode(self.value, 'base64')
+        return binascii.a2b_base64(self.value)
 
 
 class HexBinary(AbstractBinary):
+    __slots__ = ()
     name = 'hexBinary'
-    pattern = re.compile(r'^([0-9a-fA-F]{2})*$')
+    pattern = LazyPattern(r'^([0-9a-fA-F]{2})*$')
 
     @classmethod
     def validate(cls, value: object) -> None:
         if isinstance(value, cls):
             return
-        elif isinstance(value, bytes):
-            value = value.decode()
-        elif not isinstance(value, str):
+        elif not isinstance(value, (str, bytes)):
             raise cls.invalid_type(value)
 
         value = value.strip()
-        if cls.pattern.match(value) is None:
-            raise cls.invalid_value(value)
+        if value:
+            if isinstance(value, bytes):
+                data = value
+            elif value.isascii():
+                data = value.encode('ascii')  # bytes checks are faster than str ones
+            else:
+                raise cls.invalid_value(value)
+
+            # Reject whitespace between the digits before checking the encoding
+            if not data.isalnum():
+                raise cls.invalid_value(data.decode())
+            try:
+                binascii.unhexlify(data)
+            except ValueError:
+                raise cls.invalid_value(data.decode()) from None
 
     @staticmethod
     def encoder(value: bytes) -> bytes:
-        return codecs.encode(value, 'hex')
+        return binascii.hexlify(value)
 
     def decode(self) -> bytes:
-        return codecs.decode(self.value, 'hex')
+        return binascii.unhexlify(self.value)
 
     def __str__(self) -> str:
         return self.value.decode('utf-8').upper()
@@ -191,5 +250,12 @@ class HexBinary(AbstractBinary):
     def __hash__(self) -> int:
         return hash(self.value.upper())
 
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, HexBinary):
+            # Hex encodings of the same data differ only in letter case
+            return len(self.value) == len(other.value) and \
+                (self.value == other.value or self.value.upper() == other.value.upper())
+        return super().__eq__(other)
+
     def __len__(self) -> int:
         return len(self.value) // 2
@@ -13,15 +13,38 @@ import operator
 import re
 import datetime
 from calendar import isleap
+from functools import lru_cache
 from decimal import Decimal, Context
 from typing import cast, Any, Callable, Dict, Optional, Tuple, Union
 
-from ..helpers import MONTH_DAYS_LEAP, MONTH_DAYS, DAYS_IN_4Y, \
+from ..helpers import MONTH_DAYS_LEAP_CUMSUM, MONTH_DAYS_CUMSUM, DAYS_IN_4Y, \
     DAYS_IN_100Y, DAYS_IN_400Y, days_from_common_era, adjust_day, \
     normalized_seconds, months2days, round_number
 from .atomic_types import AnyAtomicType
 from .untyped import UntypedAtomic
 
+# Regex fragments shared by the lexical patterns of XSD date/time types
+YEAR_REGEX = r'(?P<year>-?[0-9]*[0-9]{4})'
+MONTH_REGEX = r'(?P<month>[0-9]{2})'
+DAY_REGEX = r'(?P<day>[0-9]{2})'
+TIME_REGEX = r'(?P<hour>[0-9]{2}):(?P<minute>[0-9]{2}):' \
+             r'(?P<second>[0-9]{2})(?:\.(?P<microsecond>[0-9]+))?'
+TIMEZONE_REGEX = r'(?P<tzinfo>Z|[+-](?:(?:0[0-9]|1[0-3]):[0-5][0-9]|14:00))'
+
+_DECIMAL_ZERO = Decimal(0)
+_MICROSECONDS_EXP = Decimal('1.000000', context=Context(prec=30))
+_QUANTIZED_ZERO = _DECIMAL_ZERO.quantize(_MICROSECONDS_EXP)
+
+
+@lru_cache(maxsize=4096)
+def _anchor_days(months: int) -> Tuple[int, int, int, int]:
+    """
+    Returns the days of a months duration added to the four starting
+    datetimes used for ordering XSD durations.
+    """
+    return (months2days(1696, 9, months), months2days(1697, 2, months),
+            months2days(1903, 3, months), months2days(1903, 7, months))
+
 
 class Timezone(datetime.tzinfo):
     """
@@ -30,6 +53,7 @@ class Timezone(datetime.tzinfo):
 
     :param offset: a timedelta instance or an XSD timezone formatted string.
     """
+    __slots__ = 'offset', '_name'
     _maxoffset = datetime.timedelta(hours=14, minutes=0)
     _minoffset = -_maxoffset
 
@@ -41,19 +65,45 @@ class Timezone(datetime.tzinfo):
             raise ValueError("offset must be between -14:00 and +14:00")
         self.offset = offset
 
+        if not offset:
+            self._name = 'Z'
+        else:
+            if offset < datetime.timedelta(0):
+                sign, offset = '-', -offset
+            else:
+                sign = '+'
+            hours, minutes = offset.seconds // 3600, offset.seconds // 60 % 60
+            self._name = f'{sign}{hours:02d}:{minutes:02d}'
+
     @classmethod
     def fromstring(cls, text: str) -> 'Timezone':
+        if isinstance(text, str):
+            return cls._cached_fromstring(text)
+        return cls._fromstring(text)
+
+    @classmethod
+    @lru_cache(maxsize=2048)
+    def _cached_fromstring(cls, text: str) -> 'Timezone':
+        # Timezone instances are immutable, so parsed values can be shared.
+        return cls._fromstring(text)
+
+    @classmethod
+    def _fromstring(cls, text: str) -> 'Timezone':
         try:
-            hours, minutes = text.strip().split(':')
+            tz_string = text.strip()
+        except AttributeError:
+            raise TypeError("argument is not a string")
+
+        if tz_string == 'Z':
+            return cls(datetime.timedelta(0))
+
+        try:
+            hours, minutes = tz_string.split(':')
             if hours.startswith('-'):
                 return cls(datetime.timedelta(hours=int(hours), minutes=-int(minutes)))
             else:
                 return cls(datetime.timedelta(hours=int(hours), minutes=int(minutes)))
-        except AttributeError:
-            raise TypeError("argument is not a string")
         except ValueError:
-            if text.strip() == 'Z':
-                return cls(datetime.timedelta(0))
             raise ValueError("%r: not an XSD timezone formatted string" % text) from None
 
     @classmethod
@@ -78,7 +128,7 @@ class Timezone(datetime.tzinfo):
         return "%s(%r)" % (self.__class__.__name__, self.offset)
 
     def __str__(self) -> str:
-        return self.tzname(None)
+        return self._name
 
     def utcoffset(self, dt: Optional[datetime.datetime]) -> datetime.timedelta:
         if not isinstance(dt, datetime.datetime) and dt is not None:
@@ -90,16 +140,7 @@ class Timezone(datetime.tzinfo):
         if not isinstance(dt, datetime.datetime) and dt is not None:
             raise TypeError("tzname() argument must be a "
                             "datetime.datetime instance or None")
-
-        if not self.offset:
-            return 'Z'
-        elif self.offset < datetime.timedelta(0):
-            sign, offset = '-', -self.offset
-        else:
-            sign, offset = '+', self.offset
-
-        hours, minutes = offset.seconds // 3600, offset.seconds // 60 % 60
-        return '{}{:02d}:{:02d}'.format(sign, hours, minutes)
+        return self._name
 
     def dst(self, dt: Optional[datetime.datetime]) -> None:
         if not isinstance(dt, datetime.datetime) and dt is not None:
@@ -117,10 +158,20 @@ class AbstractDateTime(AnyAtomicType):
     A class for representing XSD date/time objects. It uses and internal datetime.datetime
     attribute and an integer attribute for processing BCE years or for years after 9999 CE.
     """
+    __slots__ = '_dt', '_year', '_str_cache'
+
+    _dt: datetime.datetime
+    _year: Optional[int]
+    _str_cache: Optional[str]
+
     xsd_version = '1.0'
     pattern = re.compile(r'^$')
+    _group_names: Tuple[str, ...] = ()
     _utc_timezone = Timezone(datetime.timedelta(0))
-    _year = None
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._group_names = tuple(cls.pattern.groupindex)
 
     def __init__(self, year: int = 2000, month: int = 1, day: int = 1, hour: int = 0,
                  minute: int = 0, second: int = 0, microsecond: int = 0,
@@ -132,6 +183,8 @@ class AbstractDateTime(AnyAtomicType):
         else:
             delta = datetime.timedelta(0)
 
+        self._year = None
+        self._str_cache = None
         if 1 <= year <= 9999:
             self._dt = datetime.datetime(year, month, day, hour, minute,
                                          second, microsecond, tzinfo)
@@ -153,8 +206,15 @@ class AbstractDateTime(AnyAtomicType):
         if delta:
             self._dt += delta
 
+    def __getstate__(self) -> Tuple[datetime.datetime, Optional[int]]:
+        return self._dt, self._year
+
+    def __setstate__(self, state: Tuple[datetime.datetime, Optional[int]]) -> None:
+        self._dt, self._year = state
+        self._str_cache = None
+
     def __repr__(self) -> str:
-        fields = self.pattern.groupindex.keys()
+        fields = self._group_names
         arg_string = ', '.join(
             str(getattr(self, k))
             for k in ['year', 'month', 'day', 'hour', 'minute'] if k in fields
@@ -210,11 +270,11 @@ class AbstractDateTime(AnyAtomicType):
         """The ISO string representation of the year field."""
         year = self.year
         if -9999 <= year < -1:
-            return '{:05}'.format(year if self.xsd_version == '1.0' else year + 1)
+            return f'{year if self.xsd_version == "1.0" else year + 1:05}'
         elif year == -1:
             return '-0001' if self.xsd_version == '1.0' else '0000'
         elif 0 <= year <= 9999:
-            return '{:04}'.format(year)
+            return f'{year:04}'
         else:
             return str(year)
 
@@ -249,6 +309,7 @@ class AbstractDateTime(AnyAtomicType):
     @tzinfo.setter
     def tzinfo(self, tz: Timezone) -> None:
         self._dt = self._dt.replace(tzinfo=tz)
+        self._str_cache = None
 
     def tzname(self) -> Optional[str]:
         return self._dt.tzname()
@@ -282,12 +343,11 @@ class AbstractDateTime(AnyAtomicType):
             raise ValueError(msg.format(datetime_string, cls))
 
         match_dict = match.groupdict()
-        kwargs: Dict[str, int] = {
-            k: int(v) for k, v in match_dict.items() if k != 'tzinfo' and v is not None
-        }
+        tz_string = match_dict.pop('tzinfo')
+        if tz_string is not None:
+            tzinfo = Timezone.fromstring(tz_string)
 
-        if match_dict['tzinfo'] is not None:
-            tzinfo = Timezone.fromstring(match_dict['tzinfo'])
+        kwargs: Dict[str, int] = {k: int(v) for k, v in match_dict.items() if v is not None}
 
         if 'microsecond' in kwargs:
             microseconds = match_dict['microsecond']
@@ -326,7 +386,7 @@ class AbstractDateTime(AnyAtomicType):
         elif year is not None and not isinstance(year, int):
             raise TypeError('2nd argument has an invalid type %r' % type(year))
 
-        kwargs = {k: getattr(dt, k) for k in cls.pattern.groupindex.keys() if hasattr(dt, k)}
+        kwargs = {k: getattr(dt, k) for k in cls._group_names if hasattr(dt, k)}
         if year is not None:
             kwargs['year'] = year
         return cls(**kwargs)
@@ -337,14 +397,14 @@ class AbstractDateTime(AnyAtomicType):
                 isinstance(self, other.__class__):
             dt: datetime.datetime = getattr(other, '_dt', cast(datetime.datetime, other))
 
-            if self._dt.tzinfo is dt.tzinfo:
+            # Fast path: no replace needed if both are naive or both are aware
+            tz1, tz2 = self._dt.tzinfo, dt.tzinfo
+            if tz1 is tz2 or tz1 is not None and tz2 is not None:
                 return self._dt, dt
-            elif self.tzinfo is None:
+            elif tz1 is None:
                 return self._dt.replace(tzinfo=self._utc_timezone), dt
-            elif dt.tzinfo is None:
-                return self._dt, dt.replace(tzinfo=self._utc_timezone)
             else:
-                return self._dt, dt
+                return self._dt, dt.replace(tzinfo=self._utc_timezone)
         else:
             raise TypeError("wrong type %r for operand %r" % (type(other), other))
 
@@ -369,14 +429,15 @@ class AbstractDateTime(AnyAtomicType):
 
 
 class OrderedDateTime(AbstractDateTime):
+    __slots__ = ()
 
     @abstractmethod
     def __str__(self) -> str:
         raise NotImplementedError
 
     @classmethod
-    def fromdelta(cls, delta: datetime.timedelta, adjust_timezone: bool = False) \
-            -> 'OrderedDateTime':
+    def fromdelta(cls, delta: datetime.timedelta, adjust_timezone: bool = False,
+                  tzinfo: Optional[Timezone] = None) -> 'OrderedDateTime':
         """
         Creates an XSD dateTime/date instance from a datetime.timedelta related to
         0001-01-01T00:00:00 CE. In case of a date the time part is not counted.
@@ -384,6 +445,8 @@ class OrderedDateTime(AbstractDateTime):
         :param delta: a datetime.timedelta instance.
         :param adjust_timezone: if `True` adjusts the timezone of Date objects \
         with eventually present hours and minutes.
+        :param tzinfo: optional timezone to set on the created instance, \
+        the delta is not adjusted to it.
         """
         try:
             dt = datetime.datetime(1, 1, 1) + delta
@@ -443,9 +506,9 @@ class OrderedDateTime(AbstractDateTime):
                     dt = dt.replace(tzinfo=tz)
                     dt += datetime.timedelta(days=1)
 
-            return cls(year, dt.month, dt.day, tzinfo=dt.tzinfo)
+            return cls(year, dt.month, dt.day, tzinfo=dt.tzinfo if tzinfo is None else tzinfo)
         return cls(year, dt.month, dt.day, dt.hour, dt.minute,
-                   dt.second, dt.microsecond, dt.tzinfo)
+                   dt.second, dt.microsecond, dt.tzinfo if tzinfo is None else tzinfo)
 
     def todelta(self) -> datetime.timedelta:
         """Returns the datetime.timedelta from 0001-01-01T00:00:00 CE."""
@@ -457,56 +520,41 @@ class OrderedDateTime(AbstractDateTime):
         tzinfo = None if dt.tzinfo is None else self._utc_timezone
 
         if year > 0:
-            m_days = MONTH_DAYS_LEAP if isleap(year) else MONTH_DAYS
-            days = days_from_common_era(year - 1) + sum(m_days[m] for m in range(1, dt.month))
+            cumsum = MONTH_DAYS_LEAP_CUMSUM if isleap(year) else MONTH_DAYS_CUMSUM
+            days = days_from_common_era(year - 1) + cumsum[dt.month]
         else:
-            m_days = MONTH_DAYS_LEAP if isleap(year + 1) else MONTH_DAYS
-            days = days_from_common_era(year) + sum(m_days[m] for m in range(1, dt.month))
+            cumsum = MONTH_DAYS_LEAP_CUMSUM if isleap(year + 1) else MONTH_DAYS_CUMSUM
+            days = days_from_common_era(year) + cumsum[dt.month]
 
         delta = (dt - datetime.datetime(dt.year, dt.month, day=1, tzinfo=tzinfo))
         return datetime.timedelta(days=days, seconds=delta.total_seconds())
 
-    def _date_operator(self, op: Callable[[Any, Any], Any], other: object) \
-            -> Union['DayTimeDuration', 'OrderedDateTime']:
-        if isinstance(other, self.__class__):
-            dt1, dt2 = self._get_operands(other)
-            if self._year is None and other._year is None:
-                return DayTimeDuration.fromtimedelta(dt1 - dt2)
-            return DayTimeDuration.fromtimedelta(self.todelta() - other.todelta())
-
-        elif isinstance(other, datetime.timedelta):
-            delta = op(self.todelta(), other)
-            return type(self).fromdelta(delta, adjust_timezone=True)
-
-        elif isinstance(other, DayTimeDuration):
-            delta = op(self.todelta(), other.get_timedelta())
-            tzinfo = cast(Optional[Timezone], self._dt.tzinfo)
-            if tzinfo is None:
-                return type(self).fromdelta(delta)
-
-            value = type(self).fromdelta(delta + tzinfo.offset)
-            value.tzinfo = tzinfo
-            return value
-
-        elif isinstance(other, YearMonthDuration):
-            month = op(self._dt.month - 1, other.months) % 12 + 1
-            year = self.year + op(self._dt.month - 1, other.months) // 12
-            day = adjust_day(year, month, self._dt.day)
-
-            if year > 0:
-                dt = self._dt.replace(year=year, month=month, day=day)
-            elif isleap(year):
-                dt = self._dt.replace(year=4, month=month, day=day)
-            else:
-                dt = self._dt.replace(year=6, month=month, day=day)
-
-            kwargs = {k: getattr(dt, k) for k in self.pattern.groupindex.keys()}
-            if year <= 0:
-                kwargs['year'] = year
-            return type(self)(**kwargs)
+    def _add_timedelta(self, delta: datetime.timedelta) -> 'OrderedDateTime':
+        """Adds a timedelta to the instance, preserving its timezone."""
+        delta += self.todelta()
+        tzinfo = cast(Optional[Timezone], self._dt.tzinfo)
+        if tzinfo is None:
+            return type(self).fromdelta(delta)
+        return type(self).fromdelta(delta + tzinfo.offset, tzinfo=tzinfo)
+
+    def _add_months(self, months: int) -> 'OrderedDateTime':
+        """Adds a number of months to the instance, adjusting the day if necessary."""
+        months += self._dt.month - 1
+        month = months % 12 + 1
+        year = self.year + months // 12
+        day = adjust_day(year, month, self._dt.day)
 
+        if year > 0:
+            dt = self._dt.replace(year=year, month=month, day=day)
+        elif isleap(year):
+            dt = self._dt.replace(year=4, month=month, day=day)
         else:
-            raise TypeError("wrong type %r for operand %r" % (type(other), other))
+            dt = self._dt.replace(year=6, month=month, day=day)
+
+        kwargs = {k: getattr(dt, k) for k in self._group_names}
+        if year <= 0:
+            kwargs['year'] = year
+        return type(self)(**kwargs)
 
     def __lt__(self, other: object) -> bool:
         if not isinstance(other, (AbstractDateTime, datetime.datetime)):
@@ -540,23 +588,39 @@ class OrderedDateTime(AbstractDateTime):
         y1, y2 = self.year, other.year
         return y1 > y2 or y1 == y2 and dt1 >= dt2
 
-    def __add__(self, other: object) -> Union['DayTimeDuration', 'OrderedDateTime']:
-        if isinstance(other, OrderedDateTime):
+    def __add__(self, other: object) -> 'OrderedDateTime':
+        if isinstance(other, datetime.timedelta):
+            return type(self).fromdelta(self.todelta() + other, adjust_timezone=True)
+        elif isinstance(other, DayTimeDuration):
+            return self._add_timedelta(other.get_timedelta())
+        elif isinstance(other, YearMonthDuration):
+            return self._add_months(other.months)
+        else:
             raise TypeError("wrong type %r for operand %r" % (type(other), other))
-        return self._date_operator(operator.add, other)
 
     def __sub__(self, other: object) -> Union['DayTimeDuration', 'OrderedDateTime']:
-        return self._date_operator(operator.sub, other)
+        if isinstance(other, self.__class__):
+            dt1, dt2 = self._get_operands(other)
+            if self._year is None and other._year is None:
+                return DayTimeDuration.fromtimedelta(dt1 - dt2)
+            return DayTimeDuration.fromtimedelta(self.todelta() - other.todelta())
+        elif isinstance(other, datetime.timedelta):
+            return type(self).fromdelta(self.todelta() - other, adjust_timezone=True)
+        elif isinstance(other, DayTimeDuration):
+            return self._add_timedelta(-other.get_timedelta())
+        elif isinstance(other, YearMonthDuration):
+            return self._add_months(-other.months)
+        else:
+            raise TypeError("wrong type %r for operand %r" % (type(other), other))
 
 
 class DateTime10(OrderedDateTime):
     """XSD 1.0 xs:dateTime builtin type"""
+    __slots__ = ()
     name = 'dateTime'
     pattern = re.compile(
-        r'^(?P<year>-?[0-9]*[0-9]{4})-(?P<month>[0-9]{2})-(?P<day>[0-9]{2})'
-        r'(T(?P<hour>[0-9]{2}):(?P<minute>[0-9]{2}):'
-        r'(?P<second>[0-9]{2})(?:\.(?P<microsecond>[0-9]+))?)'
-        r'(?P<tzinfo>Z|[+-](?:(?:0[0-9]|1[0-3]):[0-5][0-9]|14:00))?$')
+        f'^{YEAR_REGEX}-{MONTH_REGEX}-{DAY_REGEX}T{TIME_REGEX}{TIMEZONE_REGEX}?$'
+    )
 
     def __init__(self, year: int, month: int, day: int, hour: int = 0,
                  minute: int = 0, second: int = 0, microsecond: int = 0,
@@ -566,139 +630,150 @@ class DateTime10(OrderedDateTime):
         )
 
     def __str__(self) -> str:
-        if self.microsecond:
-            return '{}-{:02}-{:02}T{:02}:{:02}:{:02}.{}{}'.format(
-                self.iso_year, self.month, self.day, self.hour, self.minute, self.second,
-                '{:06}'.format(self.microsecond).rstrip('0'), str(self.tzinfo or '')
-            )
-        return '{}-{:02}-{:02}T{:02}:{:02}:{:02}{}'.format(
-            self.iso_year, self.month, self.day, self.hour,
-            self.minute, self.second, str(self.tzinfo or '')
-        )
+        if self._str_cache is None:
+            dt = self._dt
+            fraction = f'.{dt.microsecond:06}'.rstrip('0') if dt.microsecond else ''
+            self._str_cache = f'{self.iso_year}-{dt.month:02}-{dt.day:02}T' \
+                              f'{dt.hour:02}:{dt.minute:02}:{dt.second:02}' \
+                              f'{fraction}{dt.tzinfo or ""}'
+        return self._str_cache
 
 
 class DateTime(DateTime10):
     """XSD 1.1 xs:dateTime builtin type"""
+    __slots__ = ()
     name = 'dateTime'
     xsd_version = '1.1'
 
 
 class DateTimeStamp(DateTime):
     """XSD 1.1 xs:dateTimeStamp builtin type"""
+    __slots__ = ()
     name = 'dateTimeStamp'
     pattern = re.compile(
-        r'^(?P<year>-?[0-9]*[0-9]{4})-(?P<month>[0-9]{2})-(?P<day>[0-9]{2})'
-        r'(T(?P<hour>[0-9]{2}):(?P<minute>[0-9]{2}):'
-        r'(?P<second>[0-9]{2})(?:\.(?P<microsecond>[0-9]+))?)'
-        r'(?P<tzinfo>Z|[+-](?:(?:0[0-9]|1[0-3]):[0-5][0-9]|14:00))$')
+        f'^{YEAR_REGEX}-{MONTH_REGEX}-{DAY_REGEX}T{TIME_REGEX}{TIMEZONE_REGEX}$'
+    )
 
 
 class Date10(OrderedDateTime):
     """XSD 1.0 xs:date builtin type"""
+    __slots__ = ()
     name = 'date'
-    pattern = re.compile(r'^(?P<year>-?[0-9]*[0-9]{4})-(?P<month>[0-9]{2})-(?P<day>[0-9]{2})'
-                         r'(?P<tzinfo>Z|[+-](?:(?:0[0-9]|1[0-3]):[0-5][0-9]|14:00))?$')
+    pattern = re.compile(f'^{YEAR_REGEX}-{MONTH_REGEX}-{DAY_REGEX}{TIMEZONE_REGEX}?$')
 
     def __init__(self, year: int, month: int, day: int,
                  tzinfo: Optional[datetime.tzinfo] = None) -> None:
         super(Date10, self).__init__(year, month, day, tzinfo=tzinfo)
 
     def __str__(self) -> str:
-        return '{}-{:02}-{:02}{}'.format(
-            self.iso_year, self.month, self.day, str(self.tzinfo or '')
-        )
+        if self._str_cache is None:
+            dt = self._dt
+            self._str_cache = f'{self.iso_year}-{dt.month:02}-{dt.day:02}{dt.tzinfo or ""}'
+        return self._str_cache
 
 
 class Date(Date10):
     """XSD 1.1 xs:date builtin type"""
+    __slots__ = ()
     name = 'date'
     xsd_version = '1.1'
 
 
 class GregorianDay(OrderedDateTime):
     """XSD xs:gDay builtin type"""
+    __slots__ = ()
     name = 'gDay'
-    pattern = re.compile(r'^---(?P<day>[0-9]{2})'
-                         r'(?P<tzinfo>Z|[+-](?:(?:0[0-9]|1[0-3]):[0-5][0-9]|14:00))?$')
+    pattern = re.compile(f'^---{DAY_REGEX}{TIMEZONE_REGEX}?$')
 
     def __init__(self, day: int, tzinfo: Optional[Timezone] = None) -> None:
         super(GregorianDay, self).__init__(day=day, tzinfo=tzinfo)
 
     def __str__(self) -> str:
-        return '---{:02}{}'.format(self.day, str(self.tzinfo or ''))
+        if self._str_cache is None:
+            self._str_cache = f'---{self._dt.day:02}{self._dt.tzinfo or ""}'
+        return self._str_cache
 
 
 class GregorianMonth(OrderedDateTime):
     """XSD xs:gMonth builtin type"""
+    __slots__ = ()
     name = 'gMonth'
-    pattern = re.compile(r'^--(?P<month>[0-9]{2})'
-                         r'(?P<tzinfo>Z|[+-](?:(?:0[0-9]|1[0-3]):[0-5][0-9]|14:00))?$')
+    pattern = re.compile(f'^--{MONTH_REGEX}{TIMEZONE_REGEX}?$')
 
     def __init__(self, month: int, tzinfo: Optional[Timezone] = None) -> None:
         super(GregorianMonth, self).__init__(month=month, tzinfo=tzinfo)
 
     def __str__(self) -> str:
-        return '--{:02}{}'.format(self.month, str(self.tzinfo or ''))
+        if self._str_cache is None:
+            self._str_cache = f'--{self._dt.month:02}{self._dt.tzinfo or ""}'
+        return self._str_cache
 
 
 class GregorianMonthDay(OrderedDateTime):
     """XSD xs:gMonthDay builtin type"""
+    __slots__ = ()
     name = 'gMonthDay'
-    pattern = re.compile(r'^--(?P<month>[0-9]{2})-(?P<day>[0-9]{2})'
-                         r'(?P<tzinfo>Z|[+-](?:(?:0[0-9]|1[0-3]):[0-5][0-9]|14:00))?$')
+    pattern = re.compile(f'^--{MONTH_REGEX}-{DAY_REGEX}{TIMEZONE_REGEX}?$')
 
     def __init__(self, month: int, day: int, tzinfo: Optional[Timezone] = None) -> None:
         super(GregorianMonthDay, self).__init__(month=month, day=day, tzinfo=tzinfo)
 
     def __str__(self) -> str:
-        return '--{:02}-{:02}{}'.format(self.month, self.day, str(self.tzinfo or ''))
+        if self._str_cache is None:
+            dt = self._dt
+            self._str_cache = f'--{dt.month:02}-{dt.day:02}{dt.tzinfo or ""}'
+        return self._str_cache
 
 
 class GregorianYear10(OrderedDateTime):
     """XSD 1.0 xs:gYear builtin type"""
+    __slots__ = ()
     name = 'gYear'
-    pattern = re.compile(r'^(?P<year>-?[0-9]*[0-9]{4})'
-                         r'(?P<tzinfo>Z|[+-](?:(?:0[0-9]|1[0-3]):[0-5][0-9]|14:00))?$')
+    pattern = re.compile(f'^{YEAR_REGEX}{TIMEZONE_REGEX}?$')
 
     def __init__(self, year: int, tzinfo: Optional[Timezone] = None) -> None:
         super(GregorianYear10, self).__init__(year, tzinfo=tzinfo)
 
     def __str__(self) -> str:
-        return '{}{}'.format(self.iso_year, str(self.tzinfo or ''))
+        if self._str_cache is None:
+            self._str_cache = f'{self.iso_year}{self._dt.tzinfo or ""}'
+        return self._str_cache
 
 
 class GregorianYear(GregorianYear10):
     """XSD 1.1 xs:gYear builtin type"""
+    __slots__ = ()
     name = 'gYear'
     xsd_version = '1.1'
 
 
 class GregorianYearMonth10(OrderedDateTime):
     """XSD 1.0 xs:gYearMonth builtin type"""
+    __slots__ = ()
     name = 'gYearMonth'
-    pattern = re.compile(r'^(?P<year>-?[0-9]*[0-9]{4})-(?P<month>[0-9]{2})'
-                         r'(?P<tzinfo>Z|[+-](?:(?:0[0-9]|1[0-3]):[0-5][0-9]|14:00))?$')
+    pattern = re.compile(f'^{YEAR_REGEX}-{MONTH_REGEX}{TIMEZONE_REGEX}?$')
 
     def __init__(self, year: int, month: int, tzinfo: Optional[Timezone] = None) -> None:
         super(GregorianYearMonth10, self).__init__(year, month, tzinfo=tzinfo)
 
     def __str__(self) -> str:
-        return '{}-{:02}{}'.format(self.iso_year, self.month, str(self.tzinfo or ''))
+        if self._str_cache is None:
+            self._str_cache = f'{self.iso_year}-{self._dt.month:02}{self._dt.tzinfo or ""}'
+        return self._str_cache
 
 
 class GregorianYearMonth(GregorianYearMonth10):
     """XSD 1.1 xs:gYearMonth builtin type"""
+    __slots__ = ()
     name = 'gYearMonth'
     xsd_version = '1.1'
 
 
 class Time(AbstractDateTime):
     """XSD xs:time builtin type"""
+    __slots__ = ()
     name = 'time'
-    pattern = re.compile(
-        r'^(?P<hour>[0-9]{2}):(?P<minute>[0-9]{2}):'
-        r'(?P<second>[0-9]{2})(?:\.(?P<microsecond>[0-9]+))?'
-        r'(?P<tzinfo>Z|[+-](?:(?:0[0-9]|1[0-3]):[0-5][0-9]|14:00))?$')
+    pattern = re.compile(f'^{TIME_REGEX}{TIMEZONE_REGEX}?$')
 
     def __init__(self, hour: int = 0, minute: int = 0,
                  second: int = 0, microsecond: int = 0,
@@ -710,15 +785,12 @@ class Time(AbstractDateTime):
         )
 
     def __str__(self) -> str:
-        if self.microsecond:
-            return '{:02}:{:02}:{:02}.{}{}'.format(
-                self.hour, self.minute, self.second,
-                '{:06}'.format(self.microsecond).rstrip('0'),
-                str(self.tzinfo or '')
-            )
-        return '{:02}:{:02}:{:02}{}'.format(
-            self.hour, self.minute, self.second, str(self.tzinfo or '')
-        )
+        if self._str_cache is None:
+            dt = self._dt
+            fraction = f'.{dt.microsecond:06}'.rstrip('0') if dt.microsecond else ''
+            self._str_cache = f'{dt.hour:02}:{dt.minute:02}:{dt.second:02}' \
+                              f'{fraction}{dt.tzinfo or ""}'
+        return self._str_cache
 
     def __lt__(self, other: object) -> bool:
         return cast(bool, operator.lt(*self._get_operands(other)))
@@ -763,6 +835,13 @@ class Duration(AnyAtomicType):
     :param seconds: a decimal or an integer instance that represents \
     days, hours, minutes, seconds and fractions of seconds.
     """
+    __slots__ = 'months', 'seconds', '_sign', '_hash'
+
+    months: int
+    seconds: Decimal
+    _sign: str
+    _hash: Optional[int]
+
     name = 'duration'
     pattern = re.compile(
         r'^(-)?P(?=[0-9]|T)(?:([0-9]+)Y)?(?:([0-9]+)M)?(?:([0-9]+)D)?'
@@ -778,43 +857,47 @@ class Duration(AnyAtomicType):
             raise OverflowError("seconds duration overflow")
 
         self.months = months
-        self.seconds = Decimal(seconds).quantize(Decimal('1.000000', context=Context(prec=30)))
+        if type(seconds) is not Decimal:
+            seconds = Decimal(seconds)
+        self.seconds = seconds.quantize(_MICROSECONDS_EXP)
+        self._sign = '-' if months < 0 or self.seconds < 0 else ''
+        self._hash = None
 
     def __repr__(self) -> str:
         return '{}(months={!r}, seconds={})'.format(
             self.__class__.__name__, self.months, normalized_seconds(self.seconds)
         )
 
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return self.__class__, (self.months, self.seconds)
+
     def __str__(self) -> str:
-        m = abs(self.months)
-        years, months = m // 12, m % 12
+        years, months = divmod(abs(self.months), 12)
         s = self.seconds.copy_abs()
-        days = int(s // 86400)
-        hours = int(s // 3600 % 24)
-        minutes = int(s // 60 % 60)
-        seconds = s % 60
-
-        value = '-P' if self.sign else 'P'
-        if years or months or days:
-            if years:
-                value += '%dY' % years
-            if months:
-                value += '%dM' % months
-            if days:
-                value += '%dD' % days
+        days, remainder = divmod(int(s), 86400)
+        hours, remainder = divmod(remainder, 3600)
+        minutes, remainder = divmod(remainder, 60)
+        seconds = s - int(s) + remainder
+
+        parts = ['-P' if self._sign else 'P']
+        if years:
+            parts.append(f'{years}Y')
+        if months:
+            parts.append(f'{months}M')
+        if days:
+            parts.append(f'{days}D')
 
         if hours or minutes or seconds:
-            value += 'T'
+            parts.append('T')
             if hours:
-                value += '%dH' % hours
+                parts.append(f'{hours}H')
             if minutes:
-                value += '%dM' % minutes
+                parts.append(f'{minutes}M')
             if seconds:
-                value += '%sS' % normalized_seconds(seconds)
-
-        elif value[-1] == 'P':
-            value += 'T0S'
-        return value
+                parts.append(f'{normalized_seconds(seconds)}S')
+        elif len(parts) == 1:
+            parts.append('T0S')
+        return ''.join(parts)
 
     @classmethod
     def fromstring(cls, text: str) -> 'Duration':
@@ -828,26 +911,11 @@ class Duration(AnyAtomicType):
             msg = 'argument has an invalid type {!r}'
             raise TypeError(msg.format(type(text)))
 
-        match = cls.pattern.match(text.strip())
-        if match is None:
+        values = cls._parse(text.strip())
+        if values is None:
             raise ValueError('%r is not an xs:duration value' % text)
 
-        sign, y, mo, d, h, mi, s = match.groups()
-        seconds = Decimal(s or 0)
-        minutes = int(mi or 0) + int(seconds // 60)
-        seconds = seconds % 60
-        hours = int(h or 0) + minutes // 60
-        minutes = minutes % 60
-        days = int(d or 0) + hours // 24
-        hours = hours % 24
-        months = int(mo or 0) + 12 * int(y or 0)
-
-        if sign is None:
-            seconds = seconds + (days * 24 + hours) * 3600 + minutes * 60
-        else:
-            months = -months
-            seconds = -seconds - (days * 24 + hours) * 3600 - minutes * 60
-
+        months, seconds = values
         if cls is DayTimeDuration:
             if months:
                 raise ValueError('months must be 0 for %r' % cls.__name__)
@@ -858,11 +926,33 @@ class Duration(AnyAtomicType):
             return cls(months=months)
         return cls(months=months, seconds=seconds)
 
+    @classmethod
+    @lru_cache(maxsize=1024)
+    def _parse(cls, text: str) -> Optional[Tuple[int, Union[Decimal, int]]]:
+        # Parsed values are immutable, so repeated literals share the result.
+        match = cls.pattern.match(text)
+        if match is None:
+            return None
+
+        sign, y, mo, d, h, mi, s = match.groups()
+        months = int(mo or 0) + 12 * int(y or 0)
+        seconds: Union[Decimal, int]
+        seconds = ((int(d or 0) * 24 + int(h or 0)) * 60 + int(mi or 0)) * 60
+        if s is not None:
+            if '.' in s:
+                seconds += Decimal(s)  # only a fractional seconds fragment needs a Decimal
+            else:
+                seconds += int(s)
+
+        if sign is not None:
+            return -months, -seconds
+        return months, seconds
+
     @property
     def sign(self) -> str:
-        return '-' if self.months < 0 or self.seconds < 0 else ''
+        return self._sign
 
-    def _compare_durations(self, other: object, op: Callable[[Any, Any], Any]) -> bool:
+    def _compare_durations(self, other: object, op: Callable[[int, int], bool]) -> bool:
         """
         Ordering is defined through comparison of four datetime.datetime values.
 
@@ -871,25 +961,32 @@ class Duration(AnyAtomicType):
         if not isinstance(other, self.__class__):
             raise TypeError("wrong type %r for operand %r" % (type(other), other))
 
-        m1, s1 = self.months, int(self.seconds)
-        m2, s2 = other.months, int(other.seconds)
-        ms1, ms2 = int((self.seconds - s1) * 1000000), int((other.seconds - s2) * 1000000)
-        return all([
-            op(datetime.timedelta(months2days(1696, 9, m1), s1, ms1),
-               datetime.timedelta(months2days(1696, 9, m2), s2, ms2)),
-            op(datetime.timedelta(months2days(1697, 2, m1), s1, ms1),
-               datetime.timedelta(months2days(1697, 2, m2), s2, ms2)),
-            op(datetime.timedelta(months2days(1903, 3, m1), s1, ms1),
-               datetime.timedelta(months2days(1903, 3, m2), s2, ms2)),
-            op(datetime.timedelta(months2days(1903, 7, m1), s1, ms1),
-               datetime.timedelta(months2days(1903, 7, m2), s2, ms2)),
-        ])
+        if self is other:
+            return op(0, 0)
+
+        # Components ordered the same way need no reference datetimes
+        m1, m2 = self.months, other.months
+        if m1 >= m2 and self.seconds >= other.seconds:
+            return op(0, 0) if m1 == m2 and self.seconds == other.seconds else op(1, 0)
+        elif m1 <= m2 and self.seconds <= other.seconds:
+            return op(0, 1)
+
+        # Compare the anchored durations as integer microseconds
+        us1, us2 = int(self.seconds.scaleb(6)), int(other.seconds.scaleb(6))
+        for d1, d2 in zip(_anchor_days(m1), _anchor_days(m2)):
+            if not op(d1 * 86400000000 + us1, d2 * 86400000000 + us2):
+                return False
+        return True
 
     def __hash__(self) -> int:
-        return hash((self.months, self.seconds))
+        if self._hash is None:
+            self._hash = hash((self.months, self.seconds))
+        return self._hash
 
     def __eq__(self, other: object) -> bool:
-        if isinstance(other, self.__class__):
+        if self is other:
+            return True
+        elif isinstance(other, self.__class__):
             return self.months == other.months and self.seconds == other.seconds
         elif isinstance(other, UntypedAtomic):
             return self.__eq__(self.fromstring(other.value))
@@ -919,17 +1016,33 @@ class Duration(AnyAtomicType):
 
 class YearMonthDuration(Duration):
 
+    __slots__ = ()
     name = 'yearMonthDuration'
 
     def __init__(self, months: int = 0) -> None:
-        super(YearMonthDuration, self).__init__(months, 0)
+        super(YearMonthDuration, self).__init__(months, _DECIMAL_ZERO)
+
+    @classmethod
+    def _from_months(cls, months: int) -> 'YearMonthDuration':
+        # Fast constructor for arithmetic results, there are no seconds to check.
+        if abs(months) > 2 ** 31:
+            raise OverflowError("months duration overflow")
+
+        obj = object.__new__(cls)
+        obj.months = months
+        obj.seconds = _QUANTIZED_ZERO
+        obj._sign = '-' if months < 0 else ''
+        obj._hash = None
+        return obj
 
     def __repr__(self) -> str:
         return '%s(months=%r)' % (self.__class__.__name__, self.months)
 
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return self.__class__, (self.months,)
+
     def __str__(self) -> str:
-        m = abs(self.months)
-        years, months = m // 12, m % 12
+        years, months = divmod(abs(self.months), 12)
 
         if not years:
             return '-P%dM' % months if self.months < 0 else 'P%dM' % months
@@ -943,7 +1056,7 @@ class YearMonthDuration(Duration):
     def __add__(self, other: object) \
             -> Union['YearMonthDuration', 'DayTimeDuration', 'OrderedDateTime']:
         if isinstance(other, self.__class__):
-            return YearMonthDuration(months=self.months + other.months)
+            return YearMonthDuration._from_months(self.months + other.months)
         elif isinstance(other, (DateTime10, Date10)):
             return other + self
         raise TypeError("cannot add %r to %r" % (type(other), type(self)))
@@ -951,34 +1064,58 @@ class YearMonthDuration(Duration):
     def __sub__(self, other: object) -> 'YearMonthDuration':
         if not isinstance(other, self.__class__):
             raise TypeError("cannot subtract %r from %r" % (type(other), type(self)))
-        return YearMonthDuration(months=self.months - other.months)
+        return YearMonthDuration._from_months(self.months - other.months)
 
     def __mul__(self, other: object) -> 'YearMonthDuration':
         if not isinstance(other, (float, int, Decimal)):
             raise TypeError("cannot multiply a %r by %r" % (type(self), type(other)))
-        return YearMonthDuration(months=int(round_number(self.months * other)))
+
+        months = self.months * other
+        if not isinstance(months, int):
+            months = int(round_number(months))
+        return YearMonthDuration._from_months(months)
 
     def __truediv__(self, other: object) -> Union[float, 'YearMonthDuration']:
         if isinstance(other, self.__class__):
             return self.months / other.months
-        elif isinstance(other, (float, int, Decimal)):
-            return YearMonthDuration(months=int(round_number(self.months / other)))
+        elif isinstance(other, int):
+            # Integer rounding of the quotient, halfway cases toward positive infinity
+            if other < 0:
+                months = (-2 * self.months - other) // (-2 * other)
+            else:
+                months = (2 * self.months + other) // (2 * other)
+            return YearMonthDuration._from_months(months)
+        elif isinstance(other, (float, Decimal)):
+            return YearMonthDuration._from_months(int(round_number(self.months / other)))
         else:
             raise TypeError("cannot divide a %r by %r" % (type(self), type(other)))
 
 
 class DayTimeDuration(Duration):
 
+    __slots__ = ()
     name = 'dayTimeDuration'
 
     def __init__(self, seconds: Union[Decimal, int] = 0) -> None:
         super(DayTimeDuration, self).__init__(0, seconds)
 
+    @classmethod
+    def _from_seconds(cls, seconds: Decimal) -> 'DayTimeDuration':
+        # Fast constructor for arithmetic results, there are no months to check.
+        if abs(seconds) > 2 ** 63:
+            raise OverflowError("seconds duration overflow")
+
+        obj = object.__new__(cls)
+        obj.months = 0
+        obj.seconds = seconds.quantize(_MICROSECONDS_EXP)
+        obj._sign = '-' if obj.seconds < 0 else ''
+        obj._hash = None
+        return obj
+
     @classmethod
     def fromtimedelta(cls, td: datetime.timedelta) -> 'DayTimeDuration':
-        return cls(seconds=Decimal(
-            '{}.{:06}'.format(td.days * 86400 + td.seconds, td.microseconds)
-        ))
+        microseconds = (td.days * 86400 + td.seconds) * 1000000 + td.microseconds
+        return cls(seconds=Decimal(microseconds).scaleb(-6))
 
     def get_timedelta(self) -> datetime.timedelta:
         return datetime.timedelta(
@@ -988,17 +1125,20 @@ class DayTimeDuration(Duration):
     def __repr__(self) -> str:
         return '%s(seconds=%s)' % (self.__class__.__name__, normalized_seconds(self.seconds))
 
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return self.__class__, (self.seconds,)
+
     def __add__(self, other: object) -> Union['DayTimeDuration', Time, OrderedDateTime]:
         if isinstance(other, (Time, Date10)):
             return other + self
         elif isinstance(other, self.__class__):
-            return DayTimeDuration(self.seconds + other.seconds)
+            return DayTimeDuration._from_seconds(self.seconds + other.seconds)
         raise TypeError("cannot add %r to %r" % (type(other), type(self)))
 
     def __sub__(self, other: object) -> 'DayTimeDuration':
         if not isinstance(other, self.__class__):
             raise TypeError("cannot subtract %r from %r" % (type(other), type(self)))
-        return DayTimeDuration(seconds=self.seconds - other.seconds)
+        return DayTimeDuration._from_seconds(self.seconds - other.seconds)
 
     def __mul__(self, other: object) -> 'DayTimeDuration':
         if isinstance(other, (float, int, Decimal)):
@@ -1010,7 +1150,7 @@ class DayTimeDuration(Duration):
             else:
                 seconds = self.seconds * Decimal.from_float(other)
 
-            return DayTimeDuration(seconds)
+            return DayTimeDuration._from_seconds(seconds)
         else:
             raise TypeError("cannot multiply a %r by %r" % (type(self), type(other)))
 
@@ -1026,6 +1166,6 @@ class DayTimeDuration(Duration):
             else:
                 seconds = self.seconds / Decimal.from_float(other)
 
-            return DayTimeDuration(seconds)
+            return DayTimeDuration._from_seconds(seconds)
         else:
             raise TypeError("cannot divide a %r by %r" % (type(self), type(other)))
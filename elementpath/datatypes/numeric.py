@@ -7,18 +7,17 @@
 #
 # @author Davide Brunato <brunato@sissa.it>
 #
-import re
 import math
 from typing import Any, Optional, SupportsFloat, SupportsInt, Union, Type
 
 from ..helpers import NUMERIC_INF_OR_NAN, INVALID_NUMERIC, collapse_white_spaces
-from .atomic_types import AnyAtomicType
+from .atomic_types import AnyAtomicType, LazyPattern
 
 
 class Float10(float, AnyAtomicType):
     name = 'float'
     xsd_version = '1.0'
-    pattern = re.compile(
+    pattern = LazyPattern(
         r'^(?:[+-]?(?:[0-9]+(?:\.[0-9]*)?|\.[0-9]+)(?:[Ee][+-]?[0-9]+)? |[+-]?INF|NaN)$'
     )
 
@@ -151,16 +150,18 @@ float_nan = Float10('NaN')
 class Integer(int, AnyAtomicType):
     """A wrapper for emulating xs:integer and limited integer types."""
     name = 'integer'
-    pattern = re.compile(r'^[\-+]?[0-9]+$')
+    pattern = LazyPattern(r'^[\-+]?[0-9]+$')
     lower_bound: Optional[int] = None
     higher_bound: Optional[int] = None
 
     def __init__(self, value: Union[str, SupportsInt]) -> None:
-        if self.lower_bound is not None and self < self.lower_bound:
+        # The bounds are class constants: fetch them once and skip the
+        # call to object.__init__(), that does nothing for int subclasses.
+        lower_bound, higher_bound = self.lower_bound, self.higher_bound
+        if lower_bound is not None and self < lower_bound:
             raise ValueError("value {} is too low for {!r}".format(value, self.__class__))
-        elif self.higher_bound is not None and self >= self.higher_bound:
+        elif higher_bound is not None and self >= higher_bound:
             raise ValueError("value {} is too high for {!r}".format(value, self.__class__))
-        super(Integer, self).__init__()
 
     @classmethod
     def __subclasshook__(cls, subclass: Type[Any]) -> bool:
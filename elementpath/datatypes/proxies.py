@@ -7,19 +7,21 @@
 #
 # @author Davide Brunato <brunato@sissa.it>
 #
-import re
 import math
 from decimal import Decimal
 from typing import Any, Union, SupportsFloat
 
-from ..helpers import BOOLEAN_VALUES, collapse_white_spaces, get_double
-from .atomic_types import AnyAtomicType
+from ..helpers import BOOLEAN_MAP, collapse_white_spaces, get_double
+from .atomic_types import AnyAtomicType, LazyPattern
 from .untyped import UntypedAtomic
 from .numeric import Float10, Integer
 from .datetime import AbstractDateTime, Duration
 
 FloatArgType = Union[SupportsFloat, str, bytes]
 
+NUMERIC_TYPES = (int, float, Decimal)
+ARITHMETIC_TYPES = (int, float, Decimal, AbstractDateTime, Duration, UntypedAtomic)
+
 ####
 # Type proxies for basic Python datatypes: a proxy class creates
 # and validates its Python datatype and virtual registered types.
@@ -27,7 +29,7 @@ FloatArgType = Union[SupportsFloat, str, bytes]
 
 class BooleanProxy(AnyAtomicType):
     name = 'boolean'
-    pattern = re.compile(r'^(?:true|false|1|0)$')
+    pattern = LazyPattern(r'^(?:true|false|1|0)$')
 
     def __new__(cls, value: object) -> bool:  # type: ignore[misc]
         if isinstance(value, bool):
@@ -41,9 +43,10 @@ class BooleanProxy(AnyAtomicType):
         elif not isinstance(value, str):
             raise TypeError('invalid type {!r} for xs:{}'.format(type(value), cls.name))
 
-        if value.strip() not in BOOLEAN_VALUES:
-            raise ValueError('invalid value {!r} for xs:{}'.format(value, cls.name))
-        return 't' in value or '1' in value
+        try:
+            return BOOLEAN_MAP[value.strip()]
+        except KeyError:
+            raise ValueError('invalid value {!r} for xs:{}'.format(value, cls.name)) from None
 
     @classmethod
     def __subclasshook__(cls, subclass: type) -> bool:
@@ -62,7 +65,7 @@ class BooleanProxy(AnyAtomicType):
 
 class DecimalProxy(AnyAtomicType):
     name = 'decimal'
-    pattern = re.compile(r'^[+-]?(?:[0-9]+(?:\.[0-9]*)?|\.[0-9]+)$')
+    pattern = LazyPattern(r'^[+-]?(?:[0-9]+(?:\.[0-9]*)?|\.[0-9]+)$')
 
     def __new__(cls, value: Any) -> Decimal:  # type: ignore[misc]
         if isinstance(value, (str, UntypedAtomic)):
@@ -99,7 +102,7 @@ class DecimalProxy(AnyAtomicType):
 class DoubleProxy10(AnyAtomicType):
     name = 'double'
     xsd_version = '1.0'
-    pattern = re.compile(
+    pattern = LazyPattern(
         r'^(?:[+-]?(?:[0-9]+(?:\.[0-9]*)?|\.[0-9]+)(?:[Ee][+-]?[0-9]+)?|[+-]?INF|NaN)$'
     )
 
@@ -148,13 +151,12 @@ class NumericTypeMeta(type):
     """Metaclass for checking numeric classes and instances."""
 
     def __instancecheck__(cls, instance: object) -> bool:
-        return isinstance(instance, (int, float, Decimal)) and not isinstance(instance, bool)
+        if type(instance) in NUMERIC_TYPES:
+            return True
+        return isinstance(instance, NUMERIC_TYPES) and not isinstance(instance, bool)
 
     def __subclasscheck__(cls, subclass: type) -> bool:
-        if issubclass(subclass, bool):
-            return False
-        return issubclass(subclass, int) or issubclass(subclass, float) \
-            or issubclass(subclass, Decimal)
+        return issubclass(subclass, NUMERIC_TYPES) and not issubclass(subclass, bool)
 
 
 class NumericProxy(metaclass=NumericTypeMeta):
@@ -168,16 +170,12 @@ class ArithmeticTypeMeta(type):
     """Metaclass for checking numeric, datetime and duration classes/instances."""
 
     def __instancecheck__(cls, instance: object) -> bool:
-        return isinstance(
-            instance, (int, float, Decimal, AbstractDateTime, Duration, UntypedAtomic)
-        ) and not isinstance(instance, bool)
+        if type(instance) in NUMERIC_TYPES:
+            return True
+        return isinstance(instance, ARITHMETIC_TYPES) and not isinstance(instance, bool)
 
     def __subclasscheck__(cls, subclass: type) -> bool:
-        if issubclass(subclass, bool):
-            return False
-        return issubclass(subclass, int) or issubclass(subclass, float) or \
-            issubclass(subclass, Decimal) or issubclass(subclass, Duration) \
-            or issubclass(subclass, AbstractDateTime) or issubclass(subclass, UntypedAtomic)
+        return issubclass(subclass, ARITHMETIC_TYPES) and not issubclass(subclass, bool)
 
 
 class ArithmeticProxy(metaclass=ArithmeticTypeMeta):
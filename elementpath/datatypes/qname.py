@@ -7,13 +7,24 @@
 #
 # @author Davide Brunato <brunato@sissa.it>
 #
-from typing import Any, Optional
+import sys
+from functools import lru_cache
+from typing import Any, Optional, Tuple
 
 from ..helpers import QNAME_PATTERN
 from .atomic_types import AnyAtomicType
 from .untyped import UntypedAtomic
 
 
+@lru_cache(maxsize=1024)
+def _split_qname(qname: str) -> Optional[Tuple[Optional[str], str]]:
+    """Returns the prefix and the local part of a QName, `None` if it's invalid."""
+    match = QNAME_PATTERN.match(qname)
+    if match is None:
+        return None
+    return match.group('prefix'), sys.intern(match.group('local'))
+
+
 class AbstractQName(AnyAtomicType):
     """
     XPath compliant QName, bound with a prefix and a namespace.
@@ -22,6 +33,9 @@ class AbstractQName(AnyAtomicType):
     URI if a prefixed name is provided for the 2nd argument.
     :param qname: the prefixed name or a local name.
     """
+    __slots__ = 'uri', 'qname', 'prefix', 'local_name', '_expanded_name', '_hash'
+    _hash: Optional[int]
+
     pattern = QNAME_PATTERN
 
     def __new__(cls, *args: Any, **kwargs: Any) -> 'AbstractQName':
@@ -41,23 +55,25 @@ class AbstractQName(AnyAtomicType):
             raise TypeError('the 2nd argument has an invalid type %r' % type(qname))
         self.qname = qname.strip()
 
-        match = self.pattern.match(self.qname)
-        if match is None:
+        parts = _split_qname(self.qname)
+        if parts is None:
             raise ValueError('invalid value {!r} for an xs:QName'.format(self.qname))
 
-        self.prefix = match.groupdict()['prefix']
-        self.local_name = match.groupdict()['local']
+        self.prefix, self.local_name = parts
         if not uri and self.prefix:
             msg = '{!r}: cannot associate a non-empty prefix with no namespace'
             raise ValueError(msg.format(self))
 
+        self._expanded_name = f'{{{uri}}}{self.local_name}' if uri else self.local_name
+        self._hash = None
+
     @property
     def namespace(self) -> str:
         return self.uri
 
     @property
     def expanded_name(self) -> str:
-        return '{%s}%s' % (self.uri, self.local_name) if self.uri else self.local_name
+        return self._expanded_name
 
     @property
     def braced_uri_name(self) -> str:
@@ -66,11 +82,16 @@ class AbstractQName(AnyAtomicType):
     def __repr__(self) -> str:
         return '%s(uri=%r, qname=%r)' % (self.__class__.__name__, self.uri, self.qname)
 
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return self.__class__, (self.uri, self.qname)
+
     def __str__(self) -> str:
         return self.qname
 
     def __hash__(self) -> int:
-        return hash((self.uri, self.local_name))
+        if self._hash is None:
+            self._hash = hash((self.uri, self.local_name))
+        return self._hash
 
     def __eq__(self, other: object) -> bool:
         if isinstance(other, AbstractQName):
@@ -81,8 +102,10 @@ class AbstractQName(AnyAtomicType):
 
 
 class QName(AbstractQName):
+    __slots__ = ()
     name = 'QName'
 
 
 class Notation(AbstractQName):
+    __slots__ = ()
     name = 'NOTATION'
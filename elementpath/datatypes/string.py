@@ -7,16 +7,15 @@
 #
 # @author Davide Brunato <brunato@sissa.it>
 #
-import re
 from typing import Any
 
-from ..helpers import NORMALIZE_PATTERN, collapse_white_spaces
-from .atomic_types import AnyAtomicType
+from ..helpers import NORMALIZE_PATTERN, NCNAME_REGEX, collapse_white_spaces
+from .atomic_types import AnyAtomicType, LazyPattern
 
 
 class NormalizedString(str, AnyAtomicType):
     name = 'normalizedString'
-    pattern = re.compile('^[^\t\r]*$')
+    pattern = LazyPattern('^[^\t\r]*$')
 
     def __new__(cls, obj: Any) -> 'NormalizedString':
         try:
@@ -27,7 +26,7 @@ class NormalizedString(str, AnyAtomicType):
 
 class XsdToken(NormalizedString):
     name = 'token'
-    pattern = re.compile(r'^[\S\xa0]*(?: [\S\xa0]+)*$')
+    pattern = LazyPattern(r'^[\S\xa0]*(?: [\S\xa0]+)*$')
 
     def __new__(cls, value: Any) -> 'XsdToken':
         if not isinstance(value, str):
@@ -43,7 +42,7 @@ class XsdToken(NormalizedString):
 
 class Language(XsdToken):
     name = 'language'
-    pattern = re.compile(r'^[a-zA-Z]{1,8}(-[a-zA-Z0-9]{1,8})*$')
+    pattern = LazyPattern(r'^[a-zA-Z]{1,8}(-[a-zA-Z0-9]{1,8})*$')
 
     def __new__(cls, value: Any) -> 'Language':
         if isinstance(value, bool):
@@ -61,12 +60,12 @@ class Language(XsdToken):
 
 class Name(XsdToken):
     name = 'Name'
-    pattern = re.compile(r'^(?:[^\d\W]|:)[\w.\-:\u00B7\u0300-\u036F\u203F\u2040]*$')
+    pattern = LazyPattern(r'^(?:[^\d\W]|:)[\w.\-:\u00B7\u0300-\u036F\u203F\u2040]*$')
 
 
 class NCName(Name):
     name = 'NCName'
-    pattern = re.compile(r'^[^\d\W][\w.\-\u00B7\u0300-\u036F\u203F\u2040]*$')
+    pattern = LazyPattern(f'^{NCNAME_REGEX}$')
 
 
 class Id(NCName):
@@ -83,4 +82,4 @@ class Entity(NCName):
 
 class NMToken(XsdToken):
     name = 'NMTOKEN'
-    pattern = re.compile(r'^[\w.\-:\u00B7\u0300-\u036F\u203F\u2040]+$')
+    pattern = LazyPattern(r'^[\w.\-:\u00B7\u0300-\u036F\u203F\u2040]+$')
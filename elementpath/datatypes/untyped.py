@@ -7,14 +7,34 @@
 #
 # @author Davide Brunato <brunato@sissa.it>
 #
-import operator
 from decimal import Decimal
-from typing import Any, Optional, Tuple, Union
+from typing import cast, Any, Callable, Dict, Optional, Tuple, Union
 
-from ..helpers import BOOLEAN_VALUES, get_double
+from ..helpers import BOOLEAN_MAP, get_double
 from .atomic_types import AnyAtomicType
 
 
+def _cast_to_boolean(value: str) -> bool:
+    try:
+        return BOOLEAN_MAP[value.strip()]
+    except KeyError:
+        raise ValueError("{!r} cannot be cast to xs:boolean".format(value)) from None
+
+
+# Casts of untyped values keyed by the exact type of the other operand. The
+# builtin atomic types are added at package import, other types take the
+# isinstance() checks of UntypedAtomic._get_operands().
+_OPERAND_CASTS: Dict[type, Callable[[str], Any]] = {
+    bool: _cast_to_boolean,
+    int: get_double,
+    float: float,
+    Decimal: Decimal,
+    str: str,
+    list: str,
+    type(None): str,
+}
+
+
 class UntypedAtomic(AnyAtomicType):
     """
     Class for xs:untypedAtomic data. Provides special methods for comparing
@@ -22,6 +42,7 @@ class UntypedAtomic(AnyAtomicType):
 
     :param value: the untyped value, usually a string.
     """
+    __slots__ = 'value',
     name = 'untypedAtomic'
     value: str
 
@@ -52,6 +73,9 @@ class UntypedAtomic(AnyAtomicType):
     def __repr__(self) -> str:
         return '%s(%r)' % (self.__class__.__name__, self.value)
 
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return self.__class__, (self.value,)
+
     def _get_operands(self, other: Any, force_float: bool = True) -> Tuple[Any, Any]:
         """
         Returns a couple of operands, applying a cast to the instance value based on
@@ -61,16 +85,15 @@ class UntypedAtomic(AnyAtomicType):
         :param force_float: Force a conversion to float if *other* is an UntypedAtomic instance.
         :return: A couple of values.
         """
-        if isinstance(other, UntypedAtomic):
+        cast = _OPERAND_CASTS.get(type(other))
+        if cast is not None:
+            return cast(self.value), other
+        elif isinstance(other, UntypedAtomic):
             if force_float:
                 return get_double(self.value), get_double(other.value)
             return self.value, other.value
         elif isinstance(other, bool):
-            # Cast to xs:boolean
-            value = self.value.strip()
-            if value not in BOOLEAN_VALUES:
-                raise ValueError("{!r} cannot be cast to xs:boolean".format(self.value))
-            return value in ('1', 'true'), other
+            return _cast_to_boolean(self.value), other
         elif isinstance(other, int):
             return get_double(self.value), other
         elif other is None or isinstance(other, (str, list)):
@@ -87,42 +110,54 @@ class UntypedAtomic(AnyAtomicType):
         return hash(self.value)
 
     def __eq__(self, other: Any) -> Any:
-        return operator.eq(*self._get_operands(other, force_float=False))
+        a, b = self._get_operands(other, force_float=False)
+        return a == b
 
     def __ne__(self, other: Any) -> Any:
-        return not operator.eq(*self._get_operands(other, force_float=False))
+        a, b = self._get_operands(other, force_float=False)
+        return a != b
 
     def __lt__(self, other: Any) -> Any:
-        return operator.lt(*self._get_operands(other))
+        a, b = self._get_operands(other)
+        return a < b
 
     def __le__(self, other: Any) -> Any:
-        return operator.le(*self._get_operands(other))
+        a, b = self._get_operands(other)
+        return a <= b
 
     def __gt__(self, other: Any) -> Any:
-        return operator.gt(*self._get_operands(other))
+        a, b = self._get_operands(other)
+        return a > b
 
     def __ge__(self, other: Any) -> Any:
-        return operator.ge(*self._get_operands(other))
+        a, b = self._get_operands(other)
+        return a >= b
 
     def __add__(self, other: Any) -> Any:
-        return operator.add(*self._get_operands(other))
+        a, b = self._get_operands(other)
+        return a + b
     __radd__ = __add__
 
     def __sub__(self, other: Any) -> Any:
-        return operator.sub(*self._get_operands(other))
+        a, b = self._get_operands(other)
+        return a - b
 
     def __rsub__(self, other: Any) -> Any:
-        return operator.sub(*reversed(self._get_operands(other)))
+        a, b = self._get_operands(other)
+        return b - a
 
     def __mul__(self, other: Any) -> Any:
-        return operator.mul(*self._get_operands(other))
+        a, b = self._get_operands(other)
+        return a * b
     __rmul__ = __mul__
 
     def __truediv__(self, other: Any) -> Any:
-        return operator.truediv(*self._get_operands(other))
+        a, b = self._get_operands(other)
+        return a / b
 
     def __rtruediv__(self, other: Any) -> Any:
-        return operator.truediv(*reversed(self._get_operands(other)))
+        a, b = self._get_operands(other)
+        return b / a
 
     def __int__(self) -> int:
         return int(self.value)
@@ -137,7 +172,8 @@ class UntypedAtomic(AnyAtomicType):
         return abs(Decimal(self.value))
 
     def __mod__(self, other: Any) -> Any:
-        return operator.mod(*self._get_operands(other))
+        a, b = self._get_operands(other)
+        return a % b
 
     def __round__(self, n: Optional[int] = None) -> float:
         return round(float(self.value), ndigits=n)
@@ -147,3 +183,23 @@ class UntypedAtomic(AnyAtomicType):
 
     def __bytes__(self) -> bytes:
         return bytes(self.value, encoding='utf-8')
+
+
+def _get_operand_cast(cls: type) -> Optional[Callable[[str], Any]]:
+    """
+    Returns the cast applied to untyped values by the operators for operands
+    of the given type, `None` if the cast depends on the operand instance.
+    """
+    if issubclass(cls, UntypedAtomic):
+        return None
+    elif issubclass(cls, bool):
+        return _cast_to_boolean
+    elif issubclass(cls, int):
+        return get_double
+    elif issubclass(cls, (str, list, type(None))):
+        return str
+    elif hasattr(cls, 'fromstring'):
+        return cast(Callable[[str], Any], getattr(cls, 'fromstring'))
+    elif hasattr(cls, 'ordered'):
+        return None
+    return cls
@@ -8,8 +8,9 @@
 # @author Davide Brunato <brunato@sissa.it>
 #
 from decimal import Decimal
-from urllib.parse import urlparse
-from typing import Union
+from functools import lru_cache
+from urllib.parse import urlsplit
+from typing import Any, Optional, Tuple, Union
 
 from ..helpers import collapse_white_spaces, WRONG_ESCAPE_PATTERN
 from .atomic_types import AnyAtomicType
@@ -17,12 +18,34 @@ from .untyped import UntypedAtomic
 from .numeric import Integer
 
 
+@lru_cache(maxsize=1024)
+def _check_uri(value: str) -> Optional[str]:
+    """
+    Returns the reason why a string is not a valid URI, an empty string if the
+    reason is unspecified or `None` if the URI is valid.
+    """
+    try:
+        url_parts = urlsplit(value)
+        _ = url_parts.port  # check invalid port!
+    except ValueError as err:
+        return str(err)
+    else:
+        if url_parts.path.startswith(':'):
+            return ''
+        elif value.count('#') > 1:
+            return 'too many # characters'
+        elif WRONG_ESCAPE_PATTERN.search(value) is not None:
+            return 'wrong escaping'
+        return None
+
+
 class AnyURI(AnyAtomicType):
     """
     Class for xs:anyURI data.
 
     :param value: a string or an untyped atomic instance.
     """
+    __slots__ = 'value',
     value: str
     name = 'anyURI'
 
@@ -43,6 +66,9 @@ class AnyURI(AnyAtomicType):
     def __repr__(self) -> str:
         return '%s(%r)' % (self.__class__.__name__, self.value)
 
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return self.__class__, (self.value,)
+
     def __str__(self) -> str:
         return self.value
 
@@ -98,18 +124,11 @@ class AnyURI(AnyAtomicType):
         elif not isinstance(value, str):
             raise cls.invalid_type(value)
 
-        try:
-            url_parts = urlparse(value)
-            _ = url_parts.port  # check invalid port!
-        except ValueError as err:
-            msg = 'invalid value {!r} for xs:{} ({})'
-            raise ValueError(msg.format(value, cls.name, str(err))) from None
+        reason = _check_uri(value)
+        if reason is None:
+            return
+        elif not reason:
+            raise cls.invalid_value(value)
         else:
-            if url_parts.path.startswith(':'):
-                raise cls.invalid_value(value)
-            elif value.count('#') > 1:
-                msg = 'invalid value {!r} for xs:{} (too many # characters)'
-                raise ValueError(msg.format(value, cls.name))
-            elif WRONG_ESCAPE_PATTERN.search(value) is not None:
-                msg = 'invalid value {!r} for xs:{} (wrong escaping)'
-                raise ValueError(msg.format(value, cls.name))
+            msg = 'invalid value {!r} for xs:{} ({})'
+            raise ValueError(msg.format(value, cls.name, reason))
@@ -9,8 +9,10 @@
 #
 import re
 import math
+from itertools import accumulate
 from calendar import isleap, leapdays
 from decimal import Decimal
+from functools import lru_cache
 from operator import attrgetter
 from urllib.parse import urlsplit
 from typing import Any, Iterator, List, Match, Optional, Union, SupportsFloat
@@ -19,6 +21,7 @@ from typing import Any, Iterator, List, Match, Optional, Union, SupportsFloat
 # Common sets constants
 OCCURRENCE_INDICATORS = frozenset(('?', '*', '+'))
 BOOLEAN_VALUES = frozenset(('true', 'false', '1', '0'))
+BOOLEAN_MAP = {'true': True, 'false': False, '1': True, '0': False}
 NUMERIC_INF_OR_NAN = frozenset(('INF', '-INF', 'NaN'))
 INVALID_NUMERIC = frozenset(
     ('inf', '+inf', '-inf', 'nan', 'infinity', '+infinity', '-infinity')
@@ -29,7 +32,9 @@ INVALID_NUMERIC = frozenset(
 
 NORMALIZE_PATTERN = re.compile(r'[^\S\xa0]')
 WHITESPACES_PATTERN = re.compile(r'[^\S\xa0]+')  # include ASCII 160 (non-breaking space)
-NCNAME_PATTERN = re.compile(r'^[^\d\W][\w.\-\u00B7\u0300-\u036F\u203F\u2040]*$')
+NCNAME_REGEX = r'[^\d\W][\w.\-\u00B7\u0300-\u036F\u203F\u2040]*'
+NCNAME_PATTERN = re.compile(f'^{NCNAME_REGEX}$')
+IDREFS_PATTERN = re.compile(fr'\s*(?:{NCNAME_REGEX}(?:\s+{NCNAME_REGEX})*\s*)?')
 QNAME_PATTERN = re.compile(
     r'^(?:(?P<prefix>[^\d\W][\w\-.\u00B7\u0300-\u036F\u0387\u06DD\u06DE\u203F\u2040]*):)?'
     r'(?P<local>[^\d\W][\w\-.\u00B7\u0300-\u036F\u0387\u06DD\u06DE\u203F\u2040]*)$',
@@ -48,16 +53,17 @@ def upper_camel_case(s: str) -> str:
 
 
 def collapse_white_spaces(s: str) -> str:
-    return WHITESPACES_PATTERN.sub(' ', s).strip(' ')
+    if '\xa0' in s:
+        return WHITESPACES_PATTERN.sub(' ', s).strip(' ')
+    return ' '.join(s.split())  # splits on the same whitespaces of the pattern
 
 
 def is_ncname(s: str) -> bool:
-    return re.match(r'^[^\d\W][\w.\-\u00B7\u0300-\u036F\u203F\u2040]*$', s) is not None
+    return NCNAME_PATTERN.match(s) is not None
 
 
 def is_idrefs(value: Optional[str]) -> bool:
-    return isinstance(value, str) and \
-        all(NCNAME_PATTERN.match(x) is not None for x in value.split())
+    return isinstance(value, str) and IDREFS_PATTERN.fullmatch(value) is not None
 
 
 node_position = attrgetter('position')
@@ -65,32 +71,27 @@ node_position = attrgetter('position')
 
 ###
 # Date/Time helpers
-MONTH_DAYS = [0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
-MONTH_DAYS_LEAP = [0, 31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
+MONTH_DAYS = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+MONTH_DAYS_LEAP = (0, 31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+# Cumulative days before the start of each month (index 13 is the end of the year)
+MONTH_DAYS_CUMSUM = tuple(accumulate(MONTH_DAYS, initial=0))
+MONTH_DAYS_LEAP_CUMSUM = tuple(accumulate(MONTH_DAYS_LEAP, initial=0))
 
 
 def adjust_day(year: int, month: int, day: int) -> int:
-    if month in (1, 3, 5, 7, 8, 10, 12):
-        return day
-    elif month in (4, 6, 9, 11):
-        return min(day, 30)
-    else:
-        return min(day, 29) if isleap(year) else min(day, 28)
+    return min(day, (MONTH_DAYS_LEAP if isleap(year) else MONTH_DAYS)[month])
 
 
+@lru_cache(maxsize=20000)
 def days_from_common_era(year: int) -> int:
     """
     Returns the number of days from 0001-01-01 to the provided year. For a
     common era year the days are counted until the last day of December, for a
     BCE year the days are counted down from the end to the 1st of January.
+    The same formula works for both cases, thanks to floor division semantics.
     """
-    if year > 0:
-        return year * 365 + year // 4 - year // 100 + year // 400
-    elif year >= -1:
-        return year * 366
-    else:
-        year = -year - 1
-        return -(366 + year * 365 + year // 4 - year // 100 + year // 400)
+    return year * 365 + year // 4 - year // 100 + year // 400
 
 
 DAYS_IN_4Y = days_from_common_era(4)
@@ -120,13 +121,8 @@ def months2days(year: int, month: int, months_delta: int) -> int:
     else:
         y_days = 365 * (target_year - year) + leapdays(year + 1, target_year + 1)
 
-    months_days = MONTH_DAYS_LEAP if isleap(target_year) else MONTH_DAYS
-    if target_month >= month:
-        m_days = sum(months_days[m] for m in range(month, target_month))
-        return y_days + m_days if y_days >= 0 else y_days + m_days
-    else:
-        m_days = sum(months_days[m] for m in range(target_month, month))
-        return y_days - m_days if y_days >= 0 else y_days - m_days
+    cumsum = MONTH_DAYS_LEAP_CUMSUM if isleap(target_year) else MONTH_DAYS_CUMSUM
+    return y_days + cumsum[target_month] - cumsum[month]
 
 
 def round_number(value: Union[float, int, Decimal]) -> Union[float, int, Decimal]:
@@ -13,6 +13,8 @@ XPath 1.0 implementation - part 3 (functions)
 """
 import math
 import decimal
+from copy import copy
+from itertools import islice
 
 from ..helpers import get_double
 from ..datatypes import Duration, DayTimeDuration, YearMonthDuration, \
@@ -337,12 +339,14 @@ def evaluate_substring_before_or_after_functions(self, context=None):
 @method(function('boolean', nargs=1,
                  sequence_types=('item()*', 'xs:boolean')))
 def evaluate_boolean_function(self, context=None):
-    return self.boolean_value([x for x in self[0].select(self.context or context)])
+    items = islice(self[0].select(copy(self.context or context)), 2)
+    return self.boolean_value(list(items))
 
 
 @method(function('not', nargs=1, sequence_types=('item()*', 'xs:boolean')))
 def evaluate_not_function(self, context=None):
-    return not self.boolean_value([x for x in self[0].select(self.context or context)])
+    items = islice(self[0].select(copy(self.context or context)), 2)
+    return not self.boolean_value(list(items))
 
 
 @method(function('true', nargs=0, sequence_types=('xs:boolean',)))
@@ -11,6 +11,10 @@
 """
 XPath 2.0 implementation - part 4 (XSD constructors)
 """
+from copy import copy
+from itertools import islice
+from operator import attrgetter
+
 from ..exceptions import ElementPathError, ElementPathSyntaxError
 from ..namespaces import XSD_NAMESPACE
 from ..datatypes import xsd10_atomic_types, xsd11_atomic_types, GregorianDay, \
@@ -28,6 +32,40 @@ method = XPath2Parser.method
 constructor = XPath2Parser.constructor
 
 
+def _cast_evaluate(*error_codes):
+    """
+    Returns an evaluate method for constructors that cast the data value of their
+    argument. The *error_codes* are couples of an exception class and of the code
+    of the XPath error to raise, `None` for re-raising the error bound to the token.
+    Within a schema context errors are ignored and an empty sequence is returned.
+    """
+    exceptions = tuple(cls for cls, _ in error_codes)
+
+    def evaluate(self, context=None):
+        if self.context is not None:
+            context = self.context
+
+        arg = self.data_value(self.get_argument(context))
+        if arg is None:
+            return []
+        elif arg.__class__ is UntypedAtomic:
+            arg = arg.value  # unwrap once, so casts take their string path
+
+        try:
+            return self.cast(arg)
+        except exceptions as err:
+            if isinstance(context, XPathSchemaContext):
+                return []
+
+            code = next(code for cls, code in error_codes if isinstance(err, cls))
+            if code is None:
+                err.token = self
+                raise
+            raise self.error(code, err) from None
+
+    return evaluate
+
+
 ###
 # Constructors for string-based XSD types
 @constructor('normalizedString')
@@ -77,8 +115,12 @@ def cast_numeric_types(self, value):
 @constructor('unsignedShort')
 @constructor('unsignedByte')
 def cast_integer_types(self, value):
+    cls = xsd10_atomic_types[self.symbol]
+    if value.__class__ is cls:
+        return value
+
     try:
-        return xsd10_atomic_types[self.symbol](value)
+        return cls(value)
     except ValueError:
         msg = 'could not convert {!r} to xs:{}'.format(value, self.symbol)
         if isinstance(value, (str, bytes, int, UntypedAtomic)):
@@ -108,49 +150,34 @@ def cast_date_type(self, value):
         raise self.error('FORG0001', err)
 
 
-@constructor('gDay')
-def cast_gregorian_day_type(self, value):
-    if isinstance(value, GregorianDay):
-        return value
-
-    try:
-        if isinstance(value, UntypedAtomic):
-            return GregorianDay.fromstring(value.value)
-        elif isinstance(value, (Date10, DateTime10)):
-            return GregorianDay(value.day, value.tzinfo)
-        return GregorianDay.fromstring(value)
-    except ValueError as err:
-        raise self.error('FORG0001', err)
-
+def _gregorian_cast(cls, *fields):
+    """Returns the cast function for a Gregorian type that has the same class for XSD 1.1."""
+    get_fields = attrgetter(*fields, 'tzinfo')
 
-@constructor('gMonth')
-def cast_gregorian_month_type(self, value):
-    if isinstance(value, GregorianMonth):
-        return value
+    def cast(self, value):
+        if value.__class__ is str:
+            try:
+                return cls.fromstring(value)
+            except ValueError as err:
+                raise self.error('FORG0001', err)
+        elif isinstance(value, cls):
+            return value
 
-    try:
-        if isinstance(value, UntypedAtomic):
-            return GregorianMonth.fromstring(value.value)
-        elif isinstance(value, (Date10, DateTime10)):
-            return GregorianMonth(value.month, value.tzinfo)
-        return GregorianMonth.fromstring(value)
-    except ValueError as err:
-        raise self.error('FORG0001', err)
+        try:
+            if isinstance(value, UntypedAtomic):
+                return cls.fromstring(value.value)
+            elif isinstance(value, (Date10, DateTime10)):
+                return cls(*get_fields(value))
+            return cls.fromstring(value)
+        except ValueError as err:
+            raise self.error('FORG0001', err)
 
+    return cast
 
-@constructor('gMonthDay')
-def cast_gregorian_month_day_type(self, value):
-    if isinstance(value, GregorianMonthDay):
-        return value
 
-    try:
-        if isinstance(value, UntypedAtomic):
-            return GregorianMonthDay.fromstring(value.value)
-        elif isinstance(value, (Date10, DateTime10)):
-            return GregorianMonthDay(value.month, value.day, value.tzinfo)
-        return GregorianMonthDay.fromstring(value)
-    except ValueError as err:
-        raise self.error('FORG0001', err)
+constructor('gDay')(_gregorian_cast(GregorianDay, 'day'))
+constructor('gMonth')(_gregorian_cast(GregorianMonth, 'month'))
+constructor('gMonthDay')(_gregorian_cast(GregorianMonthDay, 'month', 'day'))
 
 
 @constructor('gYear')
@@ -206,42 +233,24 @@ def cast_time_type(self, value):
         raise self.error('FORG0001', err)
 
 
-@method('date')
-@method('gDay')
-@method('gMonth')
-@method('gMonthDay')
-@method('gYear')
-@method('gYearMonth')
-@method('time')
-def evaluate_other_datetime_types(self, context=None):
-    if self.context is not None:
-        context = self.context
-
-    arg = self.data_value(self.get_argument(context))
-    if arg is None:
-        return []
-
-    try:
-        return self.cast(arg)
-    except (TypeError, OverflowError) as err:
-        if isinstance(context, XPathSchemaContext):
-            return []
-        elif isinstance(err, TypeError):
-            raise self.error('FORG0006', err) from None
-        else:
-            raise self.error('FODT0001', err) from None
+evaluate_other_datetime_types = _cast_evaluate((TypeError, 'FORG0006'),
+                                               (OverflowError, 'FODT0001'))
+for symbol in ('date', 'gDay', 'gMonth', 'gMonthDay', 'gYear', 'gYearMonth', 'time'):
+    method(symbol)(evaluate_other_datetime_types)
 
 
 ###
 # Constructors for time durations XSD types
 @constructor('duration')
 def cast_duration_type(self, value):
-    if isinstance(value, Duration):
+    if value.__class__ is str:
+        pass  # skip the ABC instance checks for the common case
+    elif isinstance(value, Duration):
         return value
+    elif isinstance(value, UntypedAtomic):
+        value = value.value
 
     try:
-        if isinstance(value, UntypedAtomic):
-            return Duration.fromstring(value.value)
         return Duration.fromstring(value)
     except OverflowError as err:
         raise self.error('FODT0002', err) from None
@@ -251,14 +260,16 @@ def cast_duration_type(self, value):
 
 @constructor('yearMonthDuration')
 def cast_year_month_duration_type(self, value):
-    if isinstance(value, YearMonthDuration):
+    if value.__class__ is str:
+        pass
+    elif isinstance(value, YearMonthDuration):
         return value
     elif isinstance(value, Duration):
         return YearMonthDuration(months=value.months)
+    elif isinstance(value, UntypedAtomic):
+        value = value.value
 
     try:
-        if isinstance(value, UntypedAtomic):
-            return YearMonthDuration.fromstring(value.value)
         return YearMonthDuration.fromstring(value)
     except OverflowError as err:
         raise self.error('FODT0002', err) from None
@@ -268,14 +279,16 @@ def cast_year_month_duration_type(self, value):
 
 @constructor('dayTimeDuration')
 def cast_day_time_duration_type(self, value):
-    if isinstance(value, DayTimeDuration):
+    if value.__class__ is str:
+        pass
+    elif isinstance(value, DayTimeDuration):
         return value
     elif isinstance(value, Duration):
         return DayTimeDuration(seconds=value.seconds)
+    elif isinstance(value, UntypedAtomic):
+        value = value.value
 
     try:
-        if isinstance(value, UntypedAtomic):
-            return DayTimeDuration.fromstring(value.value)
         return DayTimeDuration.fromstring(value)
     except OverflowError as err:
         raise self.error('FODT0002', err) from None
@@ -288,6 +301,10 @@ def cast_datetime_stamp_type(self, value):
     if isinstance(value, DateTimeStamp):
         return value
     elif isinstance(value, DateTime10):
+        if value.tzinfo is not None and not value.bce:
+            # Copy the fields, BCE years are numbered differently by XSD 1.0
+            return DateTimeStamp(value.year, value.month, value.day, value.hour,
+                                 value.minute, value.second, value.microsecond, value.tzinfo)
         value = str(value)
 
     try:
@@ -311,7 +328,7 @@ def evaluate_datetime_stamp_type(self, context=None):
 
     if isinstance(arg, UntypedAtomic):
         return self.cast(arg.value)
-    elif isinstance(arg, Date):
+    elif isinstance(arg, (Date, DateTime10)):
         return self.cast(arg)
     return self.cast(str(arg))
 
@@ -356,20 +373,9 @@ def cast_hex_binary_type(self, value):
         raise self.error('XPTY0004', err) from None
 
 
-@method('base64Binary')
-@method('hexBinary')
-def evaluate_binary_types(self, context=None):
-    arg = self.data_value(self.get_argument(self.context or context))
-    if arg is None:
-        return []
-
-    try:
-        return self.cast(arg)
-    except ElementPathError as err:
-        if isinstance(context, XPathSchemaContext):
-            return []
-        err.token = self
-        raise
+evaluate_binary_types = _cast_evaluate((ElementPathError, None))
+method('base64Binary')(evaluate_binary_types)
+method('hexBinary')(evaluate_binary_types)
 
 
 @constructor('NOTATION')
@@ -425,26 +431,16 @@ def nud_boolean_type_and_function(self):
     return self
 
 
+_evaluate_boolean_type = _cast_evaluate((ElementPathError, None))
+
+
 @method('boolean')
 def evaluate_boolean_type_and_function(self, context=None):
-    if self.context is not None:
-        context = self.context
-
     if self.label == 'function':
-        return self.boolean_value([x for x in self[0].select(context)])
-
-    # xs:boolean constructor
-    arg = self.data_value(self.get_argument(context))
-    if arg is None:
-        return []
-
-    try:
-        return self.cast(arg)
-    except ElementPathError as err:
-        if isinstance(context, XPathSchemaContext):
-            return []
-        err.token = self
-        raise
+        if self.context is not None:
+            context = self.context
+        return self.boolean_value(list(islice(self[0].select(copy(context)), 2)))
+    return _evaluate_boolean_type(self, context)  # xs:boolean constructor
 
 
 ###
@@ -573,42 +569,32 @@ def evaluate_qname_type_and_function(self, context=None):
                 raise self.error('FOCA0002', err)
 
 
+_evaluate_datetime_type = _cast_evaluate((ValueError, 'FORG0001'), (TypeError, 'FORG0006'))
+
+
 @method('dateTime')
 def evaluate_datetime_type_and_function(self, context=None):
-    if self.context is not None:
-        context = self.context
-
     if self.label == 'constructor function':
-        arg = self.data_value(self.get_argument(context))
-        if arg is None:
-            return []
+        return _evaluate_datetime_type(self, context)
+    elif self.context is not None:
+        context = self.context
 
-        try:
-            return self.cast(arg)
-        except (ValueError, TypeError) as err:
-            if isinstance(context, XPathSchemaContext):
-                return []
-            elif isinstance(err, ValueError):
-                raise self.error('FORG0001', err) from None
-            else:
-                raise self.error('FORG0006', err) from None
+    dt = self.get_argument(context, cls=Date10)
+    tm = self.get_argument(context, 1, cls=Time)
+    if dt is None or tm is None:
+        return []
+    elif dt.tzinfo == tm.tzinfo or tm.tzinfo is None:
+        tzinfo = dt.tzinfo
+    elif dt.tzinfo is None:
+        tzinfo = tm.tzinfo
     else:
-        dt = self.get_argument(context, cls=Date10)
-        tm = self.get_argument(context, 1, cls=Time)
-        if dt is None or tm is None:
-            return []
-        elif dt.tzinfo == tm.tzinfo or tm.tzinfo is None:
-            tzinfo = dt.tzinfo
-        elif dt.tzinfo is None:
-            tzinfo = tm.tzinfo
-        else:
-            raise self.error('FORG0008')
+        raise self.error('FORG0008')
 
-        if self.parser.xsd_version == '1.1':
-            return DateTime(dt.year, dt.month, dt.day, tm.hour, tm.minute,
-                            tm.second, tm.microsecond, tzinfo)
-        return DateTime10(dt.year, dt.month, dt.day, tm.hour, tm.minute,
-                          tm.second, tm.microsecond, tzinfo)
+    if self.parser.xsd_version == '1.1':
+        return DateTime(dt.year, dt.month, dt.day, tm.hour, tm.minute,
+                        tm.second, tm.microsecond, tzinfo)
+    return DateTime10(dt.year, dt.month, dt.day, tm.hour, tm.minute,
+                      tm.second, tm.microsecond, tzinfo)
 
 
 @constructor('untypedAtomic')
@@ -215,7 +215,7 @@ def evaluate_resolve_qname_function(self, context=None):
     if match is None:
         raise self.error('FOCA0002', '1st argument must be an xs:QName')
 
-    prefix = match.groupdict()['prefix'] or ''
+    prefix = match.group('prefix') or ''
     if prefix == 'xml':
         return QName(XML_NAMESPACE, qname)
 
@@ -229,9 +229,9 @@ def evaluate_resolve_qname_function(self, context=None):
             pfx = ''
         if pfx == prefix:
             if pfx:
-                return QName(uri, '{}:{}'.format(pfx, match.groupdict()['local']))
+                return QName(uri, '{}:{}'.format(pfx, match.group('local')))
             else:
-                return QName(uri, match.groupdict()['local'])
+                return QName(uri, match.group('local'))
 
     if prefix or '' in nsmap or None in nsmap:
         raise self.error('FONS0004', 'no namespace found for prefix %r' % prefix)
@@ -649,7 +649,7 @@ def select_unordered_function(self, context=None):
     if self.context is not None:
         context = self.context
 
-    yield from sorted([x for x in self[0].select(context)], key=lambda x: self.string_value(x))
+    yield from sorted(self[0].select(context), key=self.string_value)
 
 
 ###
@@ -1420,7 +1420,7 @@ def evaluate_lang_function(self, context=None):
     else:
         if not isinstance(attr, str):
             return False
-        lang = attr.strip()
+        lang = attr
 
     test_lang = self.get_argument(context, cls=str)
     if test_lang is None:
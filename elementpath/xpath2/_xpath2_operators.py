@@ -14,6 +14,7 @@ XPath 2.0 implementation - part 2 (operators, expressions and multi-role tokens)
 import math
 import operator
 from copy import copy
+from itertools import islice
 from decimal import Decimal, DivisionByZero
 
 from ..exceptions import ElementPathError
@@ -149,7 +150,7 @@ def evaluate_if_expression(self, context=None):
 
 @method('if')
 def select_if_expression(self, context=None):
-    if self.boolean_value([x for x in self[0].select(copy(context))]):
+    if self.boolean_value(list(islice(self[0].select(copy(context)), 2))):
         if isinstance(context, XPathSchemaContext):
             self[2].evaluate(copy(context))
         yield from self[1].select(context)
@@ -201,7 +202,7 @@ def evaluate_quantified_expressions(self, context=None):
 
     for results in copy(context).iter_product(selectors, varnames):
         context.variables.update(x for x in zip(varnames, results))
-        if self.boolean_value([x for x in self[-1].select(copy(context))]):
+        if self.boolean_value(list(islice(self[-1].select(copy(context)), 2))):
             if some:
                 return True
         elif not some:
@@ -32,6 +32,47 @@ from ..schema_proxy import AbstractSchemaProxy
 from ..xpath1 import XPath1Parser
 
 
+# Token methods shared by all the constructor classes
+def _constructor_nud(self: XPathConstructor) -> XPathConstructor:
+    try:
+        self.parser.advance('(')
+        self[0:] = self.parser.expression(5),
+        if self.parser.next_token.symbol == ',':
+            msg = 'Too many arguments: expected at most 1 argument'
+            raise self.error('XPST0017', msg)
+        self.parser.advance(')')
+        self.value = None
+    except SyntaxError:
+        raise self.error('XPST0017') from None
+
+    if self[0].symbol == '?':
+        self.to_partial_function()
+    return self
+
+
+def _constructor_evaluate(self: XPathConstructor, context: Optional[XPathContext] = None) \
+        -> Union[List[None], AtomicValueType]:
+    if self.context is not None:
+        context = self.context
+
+    arg = self.data_value(self.get_argument(context))
+    if arg is None:
+        return []
+    elif arg == '?' and self[0].symbol == '?':
+        raise self.error('XPTY0004', "cannot evaluate a partial function")
+
+    try:
+        if isinstance(arg, UntypedAtomic):
+            return self.cast(arg.value)
+        return self.cast(arg)
+    except ElementPathError:
+        raise
+    except (TypeError, ValueError) as err:
+        if isinstance(context, XPathSchemaContext):
+            return []
+        raise self.error('FORG0001', err) from None
+
+
 class XPath2Parser(XPath1Parser):
     """
     XPath 2.0 expression parser class. This is the default parser used by XPath selectors.
@@ -250,51 +291,13 @@ class XPath2Parser(XPath1Parser):
                     label: Union[str, Tuple[str, ...]] = 'constructor function') \
             -> Callable[[Callable[..., Any]], Callable[..., Any]]:
         """Creates a constructor token class."""
-        def nud_(self: XPathConstructor) -> XPathConstructor:
-            try:
-                self.parser.advance('(')
-                self[0:] = self.parser.expression(5),
-                if self.parser.next_token.symbol == ',':
-                    msg = 'Too many arguments: expected at most 1 argument'
-                    raise self.error('XPST0017', msg)
-                self.parser.advance(')')
-                self.value = None
-            except SyntaxError:
-                raise self.error('XPST0017') from None
-
-            if self[0].symbol == '?':
-                self.to_partial_function()
-            return self
-
-        def evaluate_(self: XPathConstructor, context: Optional[XPathContext] = None) \
-                -> Union[List[None], AtomicValueType]:
-            if self.context is not None:
-                context = self.context
-
-            arg = self.data_value(self.get_argument(context))
-            if arg is None:
-                return []
-            elif arg == '?' and self[0].symbol == '?':
-                raise self.error('XPTY0004', "cannot evaluate a partial function")
-
-            try:
-                if isinstance(arg, UntypedAtomic):
-                    return self.cast(arg.value)
-                return self.cast(arg)
-            except ElementPathError:
-                raise
-            except (TypeError, ValueError) as err:
-                if isinstance(context, XPathSchemaContext):
-                    return []
-                raise self.error('FORG0001', err) from None
-
         if not sequence_types:
             assert nargs == 1
             sequence_types = ('xs:anyAtomicType?', 'xs:%s?' % symbol)
 
         token_class = cls.register(symbol, nargs=nargs, sequence_types=sequence_types,
                                    label=label, bases=(XPathConstructor,), lbp=bp, rbp=bp,
-                                   nud=nud_, evaluate=evaluate_)
+                                   nud=_constructor_nud, evaluate=_constructor_evaluate)
 
         def bind(func: Callable[..., Any]) -> Callable[..., Any]:
             method_name = func.__name__.partition('_')[0]
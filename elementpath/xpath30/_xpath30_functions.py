@@ -20,8 +20,6 @@ from copy import copy
 from itertools import zip_longest
 from typing import cast, Any, Dict, List, Optional, Tuple
 from urllib.parse import urlsplit
-from urllib.request import urlopen
-from urllib.error import URLError
 
 try:
     import zoneinfo
@@ -1264,16 +1262,19 @@ def evaluate_unparsed_text_functions(self, context=None):
         raise self.error('FOUT1170') from None
 
     try:
-        codecs.lookup(encoding)
+        stream_reader_class = codecs.lookup(encoding).streamreader
     except LookupError:
         raise self.error('FOUT1190') from None
 
     if context is not None and uri in context.text_resources:
         text = context.text_resources[uri]
     else:
+        from urllib.request import urlopen  # a costly import, rarely needed
+        from urllib.error import URLError
+
         try:
             with urlopen(uri) as rp:
-                stream_reader = codecs.getreader(encoding)(rp)
+                stream_reader = stream_reader_class(rp)
                 text = stream_reader.read()
         except URLError as err:
             raise self.error('FOUT1170', err) from None
@@ -1328,13 +1329,16 @@ def evaluate_unparsed_text_available_function(self, context=None):
         return False
 
     try:
-        codecs.lookup(encoding)
+        stream_reader_class = codecs.lookup(encoding).streamreader
     except LookupError:
         return False
 
+    from urllib.request import urlopen
+    from urllib.error import URLError
+
     try:
         with urlopen(uri) as rp:
-            stream_reader = codecs.getreader(encoding)(rp)
+            stream_reader = stream_reader_class(rp)
             for line in stream_reader:
                 if any(not is_xml_codepoint(ord(s)) for s in line):
                     return False
@@ -20,7 +20,6 @@ import re
 from datetime import datetime, timedelta
 from decimal import Decimal
 from itertools import product
-from urllib.request import urlopen
 from urllib.parse import urlsplit
 
 from ..datatypes import AnyAtomicType, AbstractBinary, AbstractDateTime, \
@@ -657,6 +656,8 @@ def evaluate_parse_json_functions(self, context=None):
 
         try:
             if urlsplit(href).scheme:
+                from urllib.request import urlopen  # a costly import, rarely needed
+
                 with urlopen(href) as fp:
                     json_text = fp.read().decode('utf-8')
             else:
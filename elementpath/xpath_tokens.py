@@ -956,16 +956,23 @@ class XPathToken(Token[XPathTokenType]):
 
     def cast_to_qname(self, qname: str) -> QName:
         """Cast a prefixed qname string to a QName object."""
+        qname = qname.strip()
+        namespaces = self.parser.namespaces
+        prefix, sep, local_name = qname.partition(':')
+        if not sep:
+            uri = namespaces.get('')
+        elif ':' in local_name:
+            uri = None  # an invalid QName, rejected by the class
+        elif prefix in namespaces:
+            uri = namespaces[prefix]
+        else:
+            raise self.error('FONS0004', 'no namespace found for prefix {!r}'.format(prefix))
+
         try:
-            if ':' not in qname:
-                return QName(self.parser.namespaces.get(''), qname.strip())
-            pfx, _ = qname.strip().split(':')
-            return QName(self.parser.namespaces[pfx], qname)
+            return QName(uri, qname)
         except ValueError:
-            msg = 'invalid value {!r} for an xs:QName'.format(qname.strip())
+            msg = 'invalid value {!r} for an xs:QName'.format(qname)
             raise self.error('FORG0001', msg)
-        except KeyError as err:
-            raise self.error('FONS0004', 'no namespace found for prefix {}'.format(err))
 
     def cast_to_double(self, value: Union[SupportsFloat, str]) -> float:
         """Cast a value to xs:double."""
@@ -16,9 +16,11 @@ import operator
 import pickle
 import platform
 import random
+import re
 from decimal import Decimal
 from calendar import isleap
 from textwrap import dedent
+from unittest.mock import patch
 from xml.etree import ElementTree
 
 try:
@@ -30,12 +32,13 @@ from elementpath.helpers import MONTH_DAYS, MONTH_DAYS_LEAP
 from elementpath.datatypes import AnyAtomicType, DateTime, DateTime10, Date, Date10, \
     Time, Timezone, Duration, DayTimeDuration, YearMonthDuration, UntypedAtomic, \
     GregorianYear, GregorianYear10, GregorianYearMonth, GregorianYearMonth10, \
-    GregorianMonthDay, GregorianMonth, GregorianDay, AbstractDateTime, NumericProxy, \
-    ArithmeticProxy, Id, Notation, QName, Base64Binary, HexBinary, NormalizedString, \
-    XsdToken, Language, Float, Float10, Integer, Short, NegativeInteger, AnyURI, \
+    GregorianMonthDay, GregorianMonth, GregorianDay, AbstractDateTime, DateTimeStamp, \
+    NumericProxy, ArithmeticProxy, Id, Notation, QName, Base64Binary, HexBinary, \
+    NormalizedString, XsdToken, Language, Float, Float10, Integer, Short, \
+    NegativeInteger, AnyURI, \
     BooleanProxy, DecimalProxy, DoubleProxy10, DoubleProxy, StringProxy, \
     xsd10_atomic_types, xsd11_atomic_types, get_atomic_value
-from elementpath.datatypes.atomic_types import AtomicTypeMeta
+from elementpath.datatypes.atomic_types import AtomicTypeMeta, LazyPattern
 from elementpath.datatypes.datetime import OrderedDateTime
 
 
@@ -126,6 +129,21 @@ class AnyAtomicTypeTest(unittest.TestCase):
             AnotherAtomicType.validate('x')
         self.assertIn("invalid value 'x' for <class ", str(ctx.exception))
 
+    def test_lazy_pattern(self):
+        class AnotherAtomicType(metaclass=AtomicTypeMeta):
+            pattern = LazyPattern(r'^[a-z]+$')
+
+        class DerivedAtomicType(AnotherAtomicType):
+            pass
+
+        self.assertIsInstance(AnotherAtomicType.__dict__['pattern'], LazyPattern)
+        self.assertIsNone(DerivedAtomicType.validate('x'))
+        self.assertIsInstance(AnotherAtomicType.__dict__['pattern'], re.Pattern)
+        self.assertNotIn('pattern', DerivedAtomicType.__dict__)
+
+        with self.assertRaises(ValueError):
+            AnotherAtomicType.validate('X')
+
 
 class StringTypesTest(unittest.TestCase):
 
@@ -381,6 +399,24 @@ class UntypedAtomicTest(unittest.TestCase):
         self.assertFalse(-10.5 == UntypedAtomic(-10))
         self.assertFalse(-17 == UntypedAtomic(-17.3))
 
+    def test_operand_casts(self):
+        from elementpath.datatypes.untyped import _OPERAND_CASTS
+
+        casts = _OPERAND_CASTS.copy()
+        self.assertEqual(casts[Date], Date.fromstring)
+        self.assertIs(casts[Id], str)
+        self.assertNotIn(HexBinary, casts)
+
+        self.assertTrue(UntypedAtomic('2000-01-01') == Date.fromstring('2000-01-01'))
+        self.assertTrue(UntypedAtomic('F859') == HexBinary(b'F859'))
+
+        class MyDateTime(DateTime):
+            __slots__ = ()
+
+        value = MyDateTime.fromstring('2000-01-01T00:00:00')
+        self.assertTrue(UntypedAtomic('2000-01-01T00:00:00') == value)
+        self.assertEqual(_OPERAND_CASTS, casts)
+
     def test_ne(self):
         self.assertTrue(UntypedAtomic(True) != UntypedAtomic(False))
         self.assertTrue(UntypedAtomic(5.12) != UntypedAtomic(5.2))
@@ -465,6 +501,12 @@ class UntypedAtomicTest(unittest.TestCase):
         self.assertFalse(issubclass(UntypedAtomic, StringProxy))
         self.assertFalse(issubclass(UntypedAtomic, str))
 
+    def test_pickling(self):
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            value = pickle.loads(pickle.dumps(UntypedAtomic('alpha'), protocol))
+            self.assertIsInstance(value, UntypedAtomic)
+            self.assertEqual(value.value, 'alpha')
+
 
 class DateTimeTypesTest(unittest.TestCase):
 
@@ -626,6 +668,9 @@ class DateTimeTypesTest(unittest.TestCase):
         self.assertEqual(repr(dt), 'DateTime(2001, 1, 1, 0, 0, 0.000010)')
         self.assertEqual(str(dt), '2001-01-01T00:00:00.00001')
 
+        dt.tzinfo = Timezone.fromstring('+01:00')
+        self.assertEqual(str(dt), '2001-01-01T00:00:00.00001+01:00')
+
     def test_24_hour_datetime(self):
         dt = DateTime.fromstring('0000-09-19T24:00:00Z')
         self.assertEqual(str(dt), '0000-09-20T00:00:00Z')
@@ -830,6 +875,11 @@ class DateTimeTypesTest(unittest.TestCase):
                          Date.fromstring("0001-06-03"))
         self.assertEqual(DateTime.fromdelta(datetime.timedelta(days=153, seconds=72000)),
                          DateTime.fromstring("0001-06-03T20:00:00"))
+        self.assertEqual(
+            str(DateTime.fromdelta(datetime.timedelta(days=153, seconds=72000),
+                                   tzinfo=Timezone.fromstring('+01:00'))),
+            "0001-06-03T20:00:00+01:00"
+        )
 
         self.assertEqual(Date.fromdelta(datetime.timedelta(days=365)),
                          Date.fromstring("0002-01-01"))
@@ -1038,6 +1088,31 @@ class DateTimeTypesTest(unittest.TestCase):
         self.assertFalse(issubclass(DateTime10, StringProxy))
         self.assertFalse(issubclass(DateTime10, str))
 
+    def test_pickling(self):
+        values = [
+            DateTime10.fromstring('-2001-04-02T23:59:59.5+01:00'),
+            DateTime.fromstring('12000-01-01T10:30:00Z'),
+            DateTimeStamp.fromstring('2000-01-01T12:00:00-05:00'),
+            Date10.fromstring('-0001-12-31'),
+            Date.fromstring('2020-02-29Z'),
+            GregorianDay.fromstring('---31'),
+            GregorianMonth.fromstring('--12+14:00'),
+            GregorianMonthDay.fromstring('--02-29'),
+            GregorianYear10.fromstring('-10000'),
+            GregorianYear.fromstring('1999'),
+            GregorianYearMonth10.fromstring('2001-01'),
+            GregorianYearMonth.fromstring('-0033-04Z'),
+            Time.fromstring('24:00:00'),
+            Time.fromstring('13:20:00.25-08:00'),
+        ]
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            for value in values:
+                other = pickle.loads(pickle.dumps(value, protocol))
+                self.assertIs(type(other), type(value))
+                self.assertEqual(str(other), str(value))
+                self.assertEqual(repr(other), repr(value))
+                self.assertEqual(other.tzinfo, value.tzinfo)
+
 
 class DurationTypesTest(unittest.TestCase):
 
@@ -1048,6 +1123,10 @@ class DurationTypesTest(unittest.TestCase):
             Duration(months=-1, seconds=1)
         self.assertEqual(str(err.exception), "signs differ: (months=-1, seconds=1)")
 
+        with self.assertRaises(TypeError) as err:
+            Duration.fromstring([])
+        self.assertEqual(str(err.exception), "argument has an invalid type <class 'list'>")
+
         seconds = Decimal('1.0100001')
         self.assertNotEqual(Duration(seconds=seconds).seconds, seconds)
 
@@ -1088,6 +1167,14 @@ class DurationTypesTest(unittest.TestCase):
             YearMonthDuration.fromstring('P1YT10S')
         self.assertEqual(str(err.exception), "seconds must be 0 for 'YearMonthDuration'")
 
+    def test_init_fromtimedelta(self):
+        td = datetime.timedelta(days=1, seconds=5, microseconds=250)
+        self.assertEqual(DayTimeDuration.fromtimedelta(td),
+                         DayTimeDuration(seconds=Decimal('86405.000250')))
+        self.assertEqual(DayTimeDuration.fromtimedelta(-datetime.timedelta(microseconds=500000)),
+                         DayTimeDuration(seconds=Decimal('-0.5')))
+        self.assertEqual(DayTimeDuration.fromtimedelta(td).get_timedelta(), td)
+
     def test_string_representation(self):
         self.assertEqual(repr(Duration(months=1, seconds=86400)),
                          'Duration(months=1, seconds=86400)')
@@ -1189,6 +1276,17 @@ class DurationTypesTest(unittest.TestCase):
         self.assertTrue(Time(23, 59, 59) >= Time(23, 59, 59))
         self.assertFalse(Time(23, 59, 58) >= Time(23, 59, 59))
 
+    def test_comparison_fast_paths(self):
+        duration = Duration.fromstring('P1Y2DT3.5S')
+        self.assertTrue(duration == duration)
+        self.assertTrue(duration <= duration)
+        self.assertFalse(duration < duration)
+        self.assertTrue(Duration.fromstring('-P1M') < Duration.fromstring('PT1S'))
+        self.assertTrue(Duration.fromstring('P1M1D') > Duration.fromstring('P1M'))
+        self.assertTrue(Duration.fromstring('P2M') >= Duration.fromstring('P1M30D'))
+        self.assertFalse(Duration.fromstring('P1M') >= Duration.fromstring('P31D'))
+        self.assertTrue(Duration(months=3) < Duration(months=2, seconds=2 ** 60))
+
     def test_incomparable_values(self):
         self.assertFalse(Duration(1) < Duration.fromstring('P30D'))
         self.assertFalse(Duration(1) <= Duration.fromstring('P30D'))
@@ -1313,11 +1411,22 @@ class DurationTypesTest(unittest.TestCase):
         self.assertTrue(issubclass(YearMonthDuration, AnyAtomicType))
         self.assertTrue(issubclass(DayTimeDuration, AnyAtomicType))
 
+    def test_pickling(self):
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            for value in (Duration.fromstring('-P1Y2M3DT4H5M6.7S'),
+                          YearMonthDuration.fromstring('P1Y2M'),
+                          DayTimeDuration.fromstring('-PT1.25S')):
+                other = pickle.loads(pickle.dumps(value, protocol))
+                self.assertIs(type(other), type(value))
+                self.assertEqual(other, value)
+                self.assertEqual(str(other), str(value))
+
 
 class TimezoneTypeTest(unittest.TestCase):
 
     def test_init_format(self):
         self.assertEqual(Timezone.fromstring('Z').offset, datetime.timedelta(0))
+        self.assertEqual(Timezone.fromstring(' Z\n').offset, datetime.timedelta(0))
         self.assertEqual(Timezone.fromstring('00:00').offset, datetime.timedelta(0))
         self.assertEqual(Timezone.fromstring('+00:00').offset, datetime.timedelta(0))
         self.assertEqual(Timezone.fromstring('-00:00').offset, datetime.timedelta(0))
@@ -1333,11 +1442,17 @@ class TimezoneTypeTest(unittest.TestCase):
         self.assertEqual(Timezone.fromstring('-14:00').offset, datetime.timedelta(hours=-14))
 
         self.assertRaises(TypeError, Timezone.fromstring, -15)
+        for value in ([], {}):
+            with self.assertRaises(TypeError) as ctx:
+                Timezone.fromstring(value)
+            self.assertEqual(str(ctx.exception), "argument is not a string")
         self.assertRaises(ValueError, Timezone.fromstring, '-15:00')
         self.assertRaises(ValueError, Timezone.fromstring, '-14:01')
         self.assertRaises(ValueError, Timezone.fromstring, '+14:01')
         self.assertRaises(ValueError, Timezone.fromstring, '+10')
         self.assertRaises(ValueError, Timezone.fromstring, '+10:00:00')
+        self.assertRaises(ValueError, Timezone.fromstring, 'z')
+        self.assertIs(Timezone.fromstring('+05:15'), Timezone.fromstring('+05:15'))
 
         with self.assertRaises(ValueError) as ctx:
             Timezone.fromduration(Duration(seconds=3601))
@@ -1423,6 +1538,17 @@ class BinaryTypesTest(unittest.TestCase):
             if platform.python_implementation() != 'PyPy':
                 raise
 
+        self.assertEqual(Base64Binary(b' YWxw\taGE=\n').value, b'YWxwaGE=')
+        self.assertEqual(HexBinary(b' F859\r\n').value, b'F859')
+        with self.assertRaises(ValueError):
+            HexBinary(b'F8 59')
+
+        values = Base64Binary(b'YWxwaGE='), HexBinary(b'F859')
+        with patch.object(Base64Binary, 'validate') as validate:
+            for value in values:
+                Base64Binary(value)
+            validate.assert_not_called()
+
     def test_string_representation(self):
         self.assertEqual(repr(Base64Binary(b'YWxwaGE=')), "Base64Binary(b'YWxwaGE=')")
         self.assertEqual(repr(HexBinary(b'F859')), "HexBinary(b'F859')")
@@ -1454,6 +1580,9 @@ class BinaryTypesTest(unittest.TestCase):
 
         self.assertEqual(HexBinary(b'8a7f'), HexBinary(b'8A7F'))
         self.assertEqual(HexBinary(b'8A7F'), HexBinary(b'8a7f'))
+        self.assertNotEqual(HexBinary(b'8A7F'), HexBinary(b'8A7E'))
+        self.assertNotEqual(HexBinary(b'8A7F'), HexBinary(b'8A7F00'))
+        self.assertEqual(HexBinary(b'616C706861'), Base64Binary(b'YWxwaGE='))
 
         self.assertEqual(Base64Binary(b'YWxwaGE='), Base64Binary(b'YWxwaGE='))
         self.assertNotEqual(Base64Binary(b'YWxwaGE='), Base64Binary(b'ywxwaGE='))
@@ -1517,6 +1646,12 @@ class BinaryTypesTest(unittest.TestCase):
         with self.assertRaises(ValueError):
             Base64Binary.validate('FF')
 
+        self.assertIsNone(Base64Binary.validate('YW xw aGE='))
+        self.assertIsNone(Base64Binary.validate('ZQ=='))
+        for value in ('ZR==', 'YWxwaGF=', 'YW=x', 'Z===', '=AAA', 'YWxwaGE', 'YWxé'):
+            with self.assertRaises(ValueError):
+                Base64Binary.validate(value)
+
         self.assertIsNone(HexBinary.validate(HexBinary(b'F859')))
         self.assertIsNone(HexBinary.validate(b'F859'))
 
@@ -1528,8 +1663,43 @@ class BinaryTypesTest(unittest.TestCase):
         with self.assertRaises(ValueError):
             HexBinary.validate('XY')
 
+        self.assertIsNone(HexBinary.validate('0aFf'))
+        self.assertIsNone(HexBinary.validate(' 0aFf\n'))
+        for value in ('F85', 'F8 59', 'F8\t59', '0x', '\u0661\u0662', b'F8 59', b'0x'):
+            with self.assertRaises(ValueError):
+                HexBinary.validate(value)
+
+    def test_base64_scan_matches_pattern(self):
+        # The table-driven check must accept exactly the lexical space of the pattern
+        alphabet = 'AQgwZz09+/=.'
+        rng = random.Random(1234)
+        for _ in range(5000):
+            value = ''.join(rng.choice(alphabet) for _ in range(rng.randint(1, 12)))
+            match = Base64Binary.pattern.match(value)
+            self.assertEqual(Base64Binary.is_base64(value),
+                             match is not None and match.group(0) == value, msg=value)
+
+    def test_hex_check_matches_pattern(self):
+        self.assertIsNotNone(HexBinary.pattern.match('FF'))
+        alphabet = '09afAFgx'
+        rng = random.Random(1234)
+        for _ in range(2000):
+            value = ''.join(rng.choice(alphabet) for _ in range(rng.randint(1, 8)))
+            try:
+                HexBinary.validate(value)
+            except ValueError:
+                self.assertIsNone(HexBinary.pattern.match(value), msg=value)
+            else:
+                self.assertIsNotNone(HexBinary.pattern.match(value), msg=value)
+
     def test_encoder(self):
         self.assertEqual(Base64Binary.encoder(b'alpha'), b'YWxwaGE=')
+        self.assertEqual(HexBinary.encoder(b'alpha'), b'616c706861')
+
+        data = bytes(range(256))
+        self.assertNotIn(b'\n', Base64Binary.encoder(data))
+        self.assertEqual(Base64Binary(Base64Binary.encoder(data)).decode(), data)
+        self.assertEqual(HexBinary(HexBinary.encoder(data)).decode(), data)
 
     def test_decoder(self):
         try:
@@ -1565,6 +1735,31 @@ class BinaryTypesTest(unittest.TestCase):
         self.assertFalse(issubclass(HexBinary, StringProxy))
         self.assertFalse(issubclass(HexBinary, bytes))
 
+    def test_pickling(self):
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            for value in (Base64Binary(b'YWxwaGE='), HexBinary(b'F859', ordered=True)):
+                other = pickle.loads(pickle.dumps(value, protocol))
+                self.assertIs(type(other), type(value))
+                self.assertEqual(other, value)
+                self.assertEqual(other.ordered, value.ordered)
+
+    def test_error_messages(self):
+        with self.assertRaises(ValueError) as ctx:
+            HexBinary(b' XY ')
+        self.assertEqual(str(ctx.exception), "invalid value 'XY' for xs:hexBinary")
+
+        with self.assertRaises(ValueError) as ctx:
+            HexBinary.validate(b'F8 59')
+        self.assertEqual(str(ctx.exception), "invalid value 'F8 59' for xs:hexBinary")
+
+        with self.assertRaises(ValueError) as ctx:
+            Base64Binary(b'YW x')
+        self.assertEqual(str(ctx.exception), "invalid value 'YWx' for xs:base64Binary")
+
+        with self.assertRaises(ValueError) as ctx:
+            Base64Binary.validate(b'YW x')
+        self.assertEqual(str(ctx.exception), "invalid value 'YWx' for xs:base64Binary")
+
 
 class QNameTypesTest(unittest.TestCase):
 
@@ -1584,6 +1779,10 @@ class QNameTypesTest(unittest.TestCase):
             QName(10, 'foo')
         self.assertIn("invalid type <class 'int'>", str(ctx.exception))
 
+        with self.assertRaises(TypeError) as ctx:
+            QName('', [])
+        self.assertIn("2nd argument has an invalid type <class 'list'>", str(ctx.exception))
+
         qname = QName('http://xpath.test/ns', 'foo')
         self.assertEqual(qname.namespace, 'http://xpath.test/ns')
         self.assertEqual(qname.local_name, 'foo')
@@ -1666,6 +1865,15 @@ class QNameTypesTest(unittest.TestCase):
         self.assertFalse(issubclass(Notation, StringProxy))
         self.assertFalse(issubclass(Notation, str))
 
+    def test_pickling(self):
+        qname = QName('http://xpath.test/ns', 'tst:example')
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            other = pickle.loads(pickle.dumps(qname, protocol))
+            self.assertIs(type(other), QName)
+            self.assertEqual(other, qname)
+            self.assertEqual(other.prefix, 'tst')
+            self.assertEqual(other.expanded_name, qname.expanded_name)
+
 
 class AnyUriTest(unittest.TestCase):
 
@@ -1679,6 +1887,24 @@ class AnyUriTest(unittest.TestCase):
         with self.assertRaises(TypeError):
             AnyURI(1)
 
+    def test_validation(self):
+        for _ in range(2):  # invalid values are rejected also when already checked
+            with self.assertRaises(ValueError) as ctx:
+                AnyURI('http://xpath.test#a#b')
+            self.assertIn('too many # characters', str(ctx.exception))
+
+            with self.assertRaises(ValueError) as ctx:
+                AnyURI('http://xpath.test/%2')
+            self.assertIn('wrong escaping', str(ctx.exception))
+
+            with self.assertRaises(ValueError) as ctx:
+                AnyURI('http://xpath.test:x')
+            self.assertIn('xs:anyURI', str(ctx.exception))
+
+            with self.assertRaises(ValueError) as ctx:
+                AnyURI(':xpath')
+            self.assertEqual(str(ctx.exception), "invalid value ':xpath' for xs:anyURI")
+
     def test_string_representation(self):
         self.assertEqual(repr(AnyURI('http://xpath.test')), "AnyURI('http://xpath.test')")
         self.assertEqual(str(AnyURI('http://xpath.test')), 'http://xpath.test')
@@ -1733,6 +1959,23 @@ class AnyUriTest(unittest.TestCase):
         with self.assertRaises(ValueError):
             AnyURI.validate('http://[xpath.test')
 
+        with self.assertRaises(ValueError) as ctx:
+            AnyURI.validate('http://xpath.test#a#b')
+        self.assertIn('too many # characters', str(ctx.exception))
+
+        with self.assertRaises(ValueError) as ctx:
+            AnyURI.validate('http://xpath.test/a%2')
+        self.assertIn('wrong escaping', str(ctx.exception))
+        self.assertIsNone(AnyURI.validate('http://xpath.test/a%20b#c'))
+
+        with self.assertRaises(ValueError) as ctx:
+            AnyURI.validate('a%2#b#')  # the '#' count is checked first
+        self.assertIn('too many # characters', str(ctx.exception))
+
+        with self.assertRaises(TypeError) as ctx:
+            AnyURI.validate(bytearray(b'a'))
+        self.assertIn("invalid type <class 'bytearray'>", str(ctx.exception))
+
     def test_isinstance(self):
         uri = AnyURI('http://xpath.test')
         self.assertIsInstance(uri, AnyURI)
@@ -1745,6 +1988,13 @@ class AnyUriTest(unittest.TestCase):
         self.assertFalse(issubclass(AnyURI, StringProxy))
         self.assertFalse(issubclass(AnyURI, str))
 
+    def test_pickling(self):
+        uri = AnyURI('http://xpath.test')
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            other = pickle.loads(pickle.dumps(uri, protocol))
+            self.assertIs(type(other), AnyURI)
+            self.assertEqual(other, uri)
+
 
 class TypeProxiesTest(unittest.TestCase):
 
@@ -1782,6 +2032,12 @@ class TypeProxiesTest(unittest.TestCase):
     def test_boolean_proxy(self):
         self.assertTrue(BooleanProxy(1))
         self.assertFalse(BooleanProxy(float('nan')))
+        self.assertIs(BooleanProxy(' true\n'), True)
+        self.assertIs(BooleanProxy('0'), False)
+        self.assertIs(BooleanProxy(UntypedAtomic('1')), True)
+
+        with self.assertRaises(ValueError):
+            BooleanProxy('TRUE')
 
         self.assertIsNone(BooleanProxy.validate(True))
         self.assertIsNone(BooleanProxy.validate('true'))
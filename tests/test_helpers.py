@@ -26,6 +26,10 @@ class HelperFunctionsTest(unittest.TestCase):
         self.assertTrue(is_idrefs('alpha'))
         self.assertTrue(is_idrefs('alpha beta'))
         self.assertFalse(is_idrefs('12345'))
+        self.assertTrue(is_idrefs(''))
+        self.assertTrue(is_idrefs(' alpha\t beta\n'))
+        self.assertFalse(is_idrefs('alpha 12345 beta'))
+        self.assertFalse(is_idrefs(None))
 
     def test_days_from_common_era_function(self):
         days4y = 365 * 3 + 366
@@ -137,6 +141,12 @@ class HelperFunctionsTest(unittest.TestCase):
     def test_collapse_white_spaces_function(self):
         self.assertEqual(collapse_white_spaces('  ab  c  '), 'ab c')
         self.assertEqual(collapse_white_spaces('  ab\t\nc  '), 'ab c')
+        self.assertEqual(collapse_white_spaces('ab c'), 'ab c')
+        self.assertEqual(collapse_white_spaces('ab\u2003\u2003c'), 'ab c')
+        self.assertEqual(collapse_white_spaces('ab\xa0 c'), 'ab\xa0 c')
+        self.assertEqual(collapse_white_spaces('\xa0ab \x1c\n c '), '\xa0ab c')
+        self.assertEqual(collapse_white_spaces('\r\n'), '')
+        self.assertEqual(collapse_white_spaces(' a' * 1000), ' '.join('a' * 1000))
 
     def test_get_double_function(self):
         self.assertEqual(get_double(1), 1.0)
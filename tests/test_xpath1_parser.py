@@ -840,6 +840,15 @@ class XPath1ParserTest(xpath_test_class.XPathTestCase):
         root_token = self.parser.parse("not(not(node()))")
         self.assertEqual(True, root_token.evaluate(context))
 
+    def test_boolean_functions_on_shared_context(self):
+        root = self.etree.XML("<a><b/><c/></a>")
+        context = XPathContext(root=root)
+
+        for path in ('boolean(*)', 'not(*)', 'boolean(b)', 'not(not(*))'):
+            self.parser.parse(path).evaluate(context)
+            self.assertEqual(self.parser.parse('name()').evaluate(context), 'a')
+            self.assertEqual(self.parser.parse('.').evaluate(context), [context.root])
+
     def test_nonempty_elements(self):
         root = self.etree.XML("<a> <b>text</b></a>")
         context = XPathContext(root=root)
@@ -171,6 +171,10 @@ class XPath2ConstructorsTest(xpath_test_class.XPathTestCase):
 
         self.wrong_type('xs:QName(5)', 'XPTY0004', "the argument has an invalid type")
         self.wrong_value('xs:QName("1")', 'FORG0001', "invalid value")
+        self.wrong_value('xs:QName("xs:a:b")', 'FORG0001', "invalid value")
+        self.wrong_value('xs:QName("foo:a:b")', 'FORG0001', "invalid value")
+        self.check_raise('xs:QName("foo:a")', KeyError, 'FONS0004',
+                         "no namespace found for prefix 'foo'")
 
     def test_any_uri_constructor(self):
         self.check_value('xs:anyURI("")', '')
@@ -210,6 +214,11 @@ class XPath2ConstructorsTest(xpath_test_class.XPathTestCase):
         self.check_value('xs:integer("19")', 19)
         self.check_value('xs:integer(xs:untypedAtomic("19"))', 19)
         self.check_value("xs:integer('-5')", -5)
+        self.check_value("xs:integer('9007199254740993')", 9007199254740993)
+        self.check_value("xs:integer(' +123456789012345678901234567890 ')",
+                         123456789012345678901234567890)
+        self.wrong_value("xs:integer('1.0')", 'FORG0001')
+        self.wrong_value("xs:integer('1e3')", 'FORG0001')
         self.wrong_value("xs:integer('INF')", 'FORG0001')
         self.check_value("xs:integer('inf')", ValueError)
         self.wrong_value("xs:integer('NaN')", 'FORG0001')
@@ -252,6 +261,8 @@ class XPath2ConstructorsTest(xpath_test_class.XPathTestCase):
         self.wrong_value('xs:byte(128)')
         self.check_value('xs:byte("-128")', -128)
         self.check_value('xs:byte(127)', 127)
+        self.check_value('xs:byte(xs:byte(127))', 127)
+        self.wrong_value('xs:byte(xs:short(128))')
         self.check_value('xs:byte(-90)', -90)
 
         self.wrong_value('xs:unsignedLong("-10")')
@@ -384,6 +395,10 @@ class XPath2ConstructorsTest(xpath_test_class.XPathTestCase):
                              'castable as xs:dateTimeStamp', True)
             self.check_value('xs:dateTime("1969-07-20T20:18:00+07:00") '
                              'cast as xs:dateTimeStamp', ts)
+            self.check_value('xs:dateTimeStamp(xs:dateTime("1969-07-20T20:18:00+07:00"))', ts)
+            self.check_value('xs:dateTimeStamp(xs:dateTime("-0001-07-20T20:18:00.5Z"))',
+                             DateTimeStamp.fromstring("-0001-07-20T20:18:00.5Z"))
+            self.wrong_value('xs:dateTimeStamp(xs:dateTime("1969-07-20T20:18:00"))')
 
             self.check_value('xs:dateTimeStamp("2000-05-10T21:30:00+05:24")',
                              datetime.datetime(2000, 5, 10, hour=21, minute=30, tzinfo=tz1))